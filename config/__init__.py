@@ -15,6 +15,11 @@ from .config import (
     LOGS_DIR,
     CONFIG_DIR,
     STACKUP_DIR,
+    SOURCE_DIR_STR,
+    RESULTS_DIR_STR,
+    LOGS_DIR_STR,
+    CONFIG_DIR_STR,
+    STACKUP_DIR_STR,
 
     # Subdirectory Names
     CUT_SUBDIR,
@@ -30,6 +35,11 @@ from .config import (
     AEDB_EXTENSION,
     EDB_DEF_FILE,
 
+    # Cut Worker
+    CUT_WORKER_SERVER_FLAG,
+    CUT_WORKER_RESULT_PREFIX,
+    CUT_EXIT_ABORTED,
+
     # EDB Settings
     DEFAULT_EDB_VERSION,
     MIN_EDB_VERSION,
@@ -44,10 +54,13 @@ from .config import (
 
     # Validation Patterns
     VALID_CUT_NAME_PATTERN,
+    VALID_CUT_NAME_RE,
 
     # Error & Success Messages
     ERROR_MESSAGES,
     SUCCESS_MESSAGES,
+    error_message,
+    success_message,
 
     # Logging Settings
     LOG_FILE_FORMAT,
@@ -63,7 +76,7 @@ from .config import (
     get_sss_dir,
 )
 
-__all__ = [
+__all__ = (
     # Timestamp & Naming
     'TIMESTAMP_FORMAT',
     'CUT_ID_FORMAT',
@@ -75,6 +88,11 @@ __all__ = [
     'LOGS_DIR',
     'CONFIG_DIR',
     'STACKUP_DIR',
+    'SOURCE_DIR_STR',
+    'RESULTS_DIR_STR',
+    'LOGS_DIR_STR',
+    'CONFIG_DIR_STR',
+    'STACKUP_DIR_STR',
 
     # Subdirectory Names
     'CUT_SUBDIR',
@@ -90,6 +108,11 @@ __all__ = [
     'AEDB_EXTENSION',
     'EDB_DEF_FILE',
 
+    # Cut Worker
+    'CUT_WORKER_SERVER_FLAG',
+    'CUT_WORKER_RESULT_PREFIX',
+    'CUT_EXIT_ABORTED',
+
     # EDB Settings
     'DEFAULT_EDB_VERSION',
     'MIN_EDB_VERSION',
@@ -104,10 +127,13 @@ __all__ = [
 
     # Validation Patterns
     'VALID_CUT_NAME_PATTERN',
+    'VALID_CUT_NAME_RE',
 
     # Error & Success Messages
     'ERROR_MESSAGES',
     'SUCCESS_MESSAGES',
+    'error_message',
+    'success_message',
 
     # Logging Settings
     'LOG_FILE_FORMAT',
@@ -121,4 +147,4 @@ __all__ = [
     'get_edb_data_dir',
     'get_cut_dir',
     'get_sss_dir',
-]
+)
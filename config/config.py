@@ -4,7 +4,10 @@ Global configuration and constants for EDB Cascade application.
 This module centralizes all magic numbers, file patterns, and configuration constants
 used throughout the project to improve maintainability.
 """
+import functools
+import re
 from pathlib import Path
+from types import MappingProxyType
 
 # ============================================================================
 # TIMESTAMP & NAMING
@@ -21,19 +24,25 @@ BATCH_FILE_PREFIX = '_batch_'
 # ============================================================================
 # DIRECTORY PATHS
 # ============================================================================
-SOURCE_DIR = Path('source')
+SOURCE_DIR_STR = 'source'
+RESULTS_DIR_STR = 'Results'
+LOGS_DIR_STR = 'logs'
+CONFIG_DIR_STR = 'config'
+STACKUP_DIR_STR = 'stackup'
+
+SOURCE_DIR = Path(SOURCE_DIR_STR)
 """Base directory for extracted EDB data"""
 
-RESULTS_DIR = Path('Results')
+RESULTS_DIR = Path(RESULTS_DIR_STR)
 """Base directory for analysis results"""
 
-LOGS_DIR = Path('logs')
+LOGS_DIR = Path(LOGS_DIR_STR)
 """Base directory for application logs"""
 
-CONFIG_DIR = Path('config')
+CONFIG_DIR = Path(CONFIG_DIR_STR)
 """Base directory for configuration files"""
 
-STACKUP_DIR = Path('stackup')
+STACKUP_DIR = Path(STACKUP_DIR_STR)
 """Base directory for stackup Excel files (used with FPCB-Extractor)"""
 
 # ============================================================================
@@ -63,6 +72,18 @@ SSS_EXTENSION = '.sss'
 AEDB_EXTENSION = '.aedb'
 EDB_DEF_FILE = 'edb.def'
 
+# ============================================================================
+# CUT WORKER
+# ============================================================================
+CUT_WORKER_SERVER_FLAG = '--server'
+"""Command line flag that starts edb.cut as a persistent worker reading jobs from stdin"""
+
+CUT_WORKER_RESULT_PREFIX = '@@EDB_CUT_RESULT '
+"""Prefix of the stdout line carrying a worker job result (followed by JSON)"""
+
+CUT_EXIT_ABORTED = 2
+"""Cut job exit code when remaining clones were skipped after a failure (EDB_CUT_FAIL_FAST=1)"""
+
 # ============================================================================
 # EDB SETTINGS
 # ============================================================================
@@ -89,27 +110,64 @@ ANALYSIS_WINDOW_TITLE = 'EDB Analysis - Touchstone Generator'
 VALID_CUT_NAME_PATTERN = r'^[a-zA-Z0-9_]+$'
 """Regex pattern for valid cut names (alphanumeric + underscore)"""
 
+VALID_CUT_NAME_RE = re.compile(VALID_CUT_NAME_PATTERN)
+"""Precompiled form of VALID_CUT_NAME_PATTERN"""
+
 # ============================================================================
 # ERROR MESSAGES
 # ============================================================================
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     'file_not_found': 'File not found: {path}',
     'invalid_cut_name': 'Invalid name format. Only letters, numbers, and underscores allowed.',
     'cut_exists': 'Cut name "{name}" already exists',
     'no_cuts_provided': 'No cut IDs provided',
     'cut_execution_failed': 'Cut execution failed with code {code}',
+    'cut_execution_aborted': 'Cut execution stopped at the first failed clone (fail-fast)',
     'no_folder_selected': 'No folder selected',
-}
+})
+"""Read-only error message templates"""
 
 # ============================================================================
 # SUCCESS MESSAGES
 # ============================================================================
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = MappingProxyType({
     'cut_saved': 'Cut data saved: {path}',
     'cut_deleted': 'Deleted cut: {path}',
     'cut_renamed': 'Renamed cut: {old_id} -> {new_id}',
     'cuts_executed': '{count} cut(s) executed successfully!',
-}
+})
+"""Read-only success message templates"""
+
+
+def error_message(key, **kwargs):
+    """
+    Format an entry of ERROR_MESSAGES.
+
+    Args:
+        key: ERROR_MESSAGES key (unknown keys are returned unchanged)
+        **kwargs: Values substituted into the message template
+
+    Returns:
+        str: Formatted error message
+    """
+    template = ERROR_MESSAGES.get(key, key)
+    return template.format_map(kwargs) if kwargs else template
+
+
+def success_message(key, **kwargs):
+    """
+    Format an entry of SUCCESS_MESSAGES.
+
+    Args:
+        key: SUCCESS_MESSAGES key (unknown keys are returned unchanged)
+        **kwargs: Values substituted into the message template
+
+    Returns:
+        str: Formatted success message
+    """
+    template = SUCCESS_MESSAGES.get(key, key)
+    return template.format_map(kwargs) if kwargs else template
+
 
 # ============================================================================
 # LOGGING SETTINGS
@@ -123,6 +181,10 @@ LOG_MAX_LINE_LENGTH = 2000
 # ============================================================================
 # RESPONSE SCHEMAS
 # ============================================================================
+_SUCCESS_EMPTY = MappingProxyType({'success': True})
+"""Read-only template for a success response without payload"""
+
+
 def success_response(data=None, **kwargs):
     """
     Create standardized success response.
@@ -134,6 +196,9 @@ def success_response(data=None, **kwargs):
     Returns:
         dict: Success response dictionary
     """
+    if data is None and not kwargs:
+        return dict(_SUCCESS_EMPTY)
+
     response = {'success': True}
     if data is not None:
         response['data'] = data
@@ -152,16 +217,19 @@ def error_response(error, message=None):
     Returns:
         dict: Error response dictionary
     """
+    error_str = str(error)
     return {
         'success': False,
-        'error': str(error),
-        'message': message or str(error)
+        'error': error_str,
+        'message': message or error_str
     }
 
 
 # ============================================================================
 # PATH HELPERS
 # ============================================================================
+# Path objects are immutable, so memoized results can be shared by callers.
+@functools.lru_cache(maxsize=64)
 def get_edb_data_dir(edb_folder_name):
     """
     Get data directory for specific EDB.
@@ -172,9 +240,10 @@ def get_edb_data_dir(edb_folder_name):
     Returns:
         Path: Path to source/{edb_folder_name}/
     """
-    return SOURCE_DIR / edb_folder_name
+    return Path(SOURCE_DIR_STR, edb_folder_name)
 
 
+@functools.lru_cache(maxsize=64)
 def get_cut_dir(edb_folder_name):
     """
     Get cut directory for specific EDB.
@@ -185,9 +254,10 @@ def get_cut_dir(edb_folder_name):
     Returns:
         Path: Path to source/{edb_folder_name}/cut/
     """
-    return get_edb_data_dir(edb_folder_name) / CUT_SUBDIR
+    return Path(SOURCE_DIR_STR, edb_folder_name, CUT_SUBDIR)
 
 
+@functools.lru_cache(maxsize=64)
 def get_sss_dir(edb_folder_name):
     """
     Get SSS directory for specific EDB.
@@ -198,4 +268,4 @@ def get_sss_dir(edb_folder_name):
     Returns:
         Path: Path to source/{edb_folder_name}/sss/
     """
-    return get_edb_data_dir(edb_folder_name) / SSS_SUBDIR
+    return Path(SOURCE_DIR_STR, edb_folder_name, SSS_SUBDIR)
@@ -1,8 +1,8 @@
 """EDB extraction module"""
 from .edb_extract import extract_component_positions, extract_plane_positions, extract_trace_positions
 
-__all__ = [
+__all__ = (
     'extract_component_positions',
     'extract_plane_positions',
-    'extract_trace_positions'
-]
+    'extract_trace_positions',
+)
@@ -1,8 +1,10 @@
 """Entry point for running edb package as a module: python -m edb"""
 import sys
-from pathlib import Path
 from .edb_interface import interface
 
+# Default EDB opened when no path argument is given
+_DEFAULT_EDB_PATH = r"C:\Python_Code\2511_EDB_Cutter_pywebview\source\example\part2_otherstackup.aedb"
+
 if __name__ == "__main__":
     # Get EDB path from command line argument
     if len(sys.argv) > 1:
@@ -16,4 +18,4 @@ if __name__ == "__main__":
         interface(edbpath=edb_path, edbversion=edb_version, grpc=grpc)
     else:
         # Default path if no argument provided
-        interface(edbpath=r"C:\Python_Code\2511_EDB_Cutter_pywebview\source\example\part2_otherstackup.aedb", grpc=True)
+        interface(edbpath=_DEFAULT_EDB_PATH, grpc=True)
@@ -5,6 +5,17 @@ This module provides SIwave and HFSS 3D Layout analysis functionality for EDB fi
 It runs in a subprocess to avoid pythonnet conflicts with pywebview.
 """
 from .siwave_analysis import run_siwave_analysis
-from hfss import run_hfss_analysis
 
-__all__ = ['run_siwave_analysis', 'run_hfss_analysis']
+
+def run_hfss_analysis(*args, **kwargs):
+    """
+    Run HFSS 3D Layout analysis (see hfss.hfss_analysis.run_hfss_analysis).
+
+    The hfss package is imported on first use so SIwave-only subprocesses
+    do not pay its import cost.
+    """
+    from hfss import run_hfss_analysis as _run_hfss_analysis
+    return _run_hfss_analysis(*args, **kwargs)
+
+
+__all__ = ('run_siwave_analysis', 'run_hfss_analysis')
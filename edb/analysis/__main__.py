@@ -5,42 +5,66 @@ This script is run as a subprocess to execute SIwave or HFSS analysis operations
 It isolates pythonnet dependencies from the pywebview GUI.
 """
 import sys
-from pathlib import Path
+from typing import NamedTuple
 from util.logger_module import logger
 from . import run_siwave_analysis, run_hfss_analysis
 
 
-if __name__ == "__main__":
+class Args(NamedTuple):
+    """Parsed command line arguments for the analysis subprocess"""
+    aedb_path: str
+    edb_version: str
+    output_path: str
+    grpc: bool
+    analysis_type: str
+
+
+def parse_args(argv):
     """
-    Main entry point for subprocess.
+    Parse command line arguments once.
 
     Expected command line arguments:
-        sys.argv[1]: aedb_path (path to .aedb folder or edb.def file)
-        sys.argv[2]: edb_version (e.g., "2025.1")
-        sys.argv[3]: output_path (path for touchstone output file)
-        sys.argv[4]: grpc (optional, "True" or "False", default: "False")
-        sys.argv[5]: analysis_type (optional, "siwave" or "hfss", default: "siwave")
+        argv[1]: aedb_path (path to .aedb folder or edb.def file)
+        argv[2]: edb_version (e.g., "2025.1")
+        argv[3]: output_path (path for touchstone output file)
+        argv[4]: grpc (optional, "True" or "False", default: "False")
+        argv[5]: analysis_type (optional, "siwave" or "hfss", default: "siwave")
+
+    Returns:
+        Args: Parsed arguments (exits with code 1 if required ones are missing)
     """
-    if len(sys.argv) < 4:
-        logger.info("[ERROR] Insufficient arguments")
-        logger.info("Usage: python -m edb.analysis <aedb_path> <edb_version> <output_path> [grpc] [analysis_type]")
+    argc = len(argv)
+    if argc < 4:
+        logger.info(
+            "[ERROR] Insufficient arguments\n"
+            "Usage: python -m edb.analysis <aedb_path> <edb_version> <output_path> [grpc] [analysis_type]"
+        )
         sys.exit(1)
 
-    aedb_path = sys.argv[1]
-    edb_version = sys.argv[2]
-    output_path = sys.argv[3]
-    grpc = sys.argv[4].lower() == 'true' if len(sys.argv) > 4 else False
-    analysis_type = sys.argv[5] if len(sys.argv) > 5 else 'siwave'
+    return Args(
+        aedb_path=argv[1],
+        edb_version=argv[2],
+        output_path=argv[3],
+        grpc=argc > 4 and argv[4].lower() == 'true',
+        analysis_type=argv[5] if argc > 5 else 'siwave',
+    )
+
+
+if __name__ == "__main__":
+    """Main entry point for subprocess."""
+    aedb_path, edb_version, output_path, grpc, analysis_type = parse_args(sys.argv)
 
-    logger.info("=" * 70)
-    logger.info("EDB Analysis Subprocess")
-    logger.info("=" * 70)
-    logger.info(f"AEDB Path: {aedb_path}")
-    logger.info(f"EDB Version: {edb_version}")
-    logger.info(f"Output Path: {output_path}")
-    logger.info(f"gRPC Mode: {grpc}")
-    logger.info(f"Analysis Type: {analysis_type.upper()}")
-    logger.info("")
+    separator = "=" * 70
+    logger.info(
+        f"{separator}\n"
+        "EDB Analysis Subprocess\n"
+        f"{separator}\n"
+        f"AEDB Path: {aedb_path}\n"
+        f"EDB Version: {edb_version}\n"
+        f"Output Path: {output_path}\n"
+        f"gRPC Mode: {grpc}\n"
+        f"Analysis Type: {analysis_type.upper()}\n"
+    )
 
     try:
         # Select analysis type
@@ -54,23 +78,28 @@ if __name__ == "__main__":
             analysis_name = "SIwave"
 
         if result['success']:
-            logger.info("=" * 70)
-            logger.info(f"[SUCCESS] {analysis_name} analysis completed successfully")
-            logger.info(f"Output file: {result['output_file']}")
-            logger.info(f"File size: {result.get('file_size', 0):,} bytes")
-            logger.info("=" * 70)
+            logger.info(
+                f"{separator}\n"
+                f"[SUCCESS] {analysis_name} analysis completed successfully\n"
+                f"Output file: {result['output_file']}\n"
+                f"File size: {result.get('file_size', 0):,} bytes\n"
+                f"{separator}"
+            )
             sys.exit(0)
         else:
-            logger.info("=" * 70)
-            logger.info(f"[ERROR] {analysis_name} analysis failed")
-            logger.info(f"Error: {result.get('error', 'Unknown error')}")
-            logger.info("=" * 70)
+            logger.info(
+                f"{separator}\n"
+                f"[ERROR] {analysis_name} analysis failed\n"
+                f"Error: {result.get('error', 'Unknown error')}\n"
+                f"{separator}"
+            )
             sys.exit(1)
 
     except Exception as e:
-        logger.info("=" * 70)
+        logger.info(separator)
         logger.error(f"Unexpected error: {e}")
         import traceback
-        traceback.print_exc()
-        logger.info("=" * 70)
+        # Negative limit keeps the innermost frames, where the error was raised
+        traceback.print_exception(e, limit=-10)
+        logger.info(separator)
         sys.exit(1)
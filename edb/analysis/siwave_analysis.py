@@ -3,9 +3,29 @@ SIwave Analysis Module
 
 This module provides SIwave analysis functionality for EDB files.
 """
+import os
 import traceback
 from pathlib import Path
 from util.logger_module import logger
+from util.path_utils import ensure_dir, find_touchstone_file
+
+# pyedb module, imported on first successful path validation
+_PYEDB = None
+
+# Accepted EDB path endings: .aedb folder or edb.def file inside it
+_EDB_PATH_SUFFIXES = ('.aedb', os.sep + 'edb.def')
+
+
+def _format_traceback():
+    """
+    Format the current exception traceback for error responses.
+
+    Set EDB_SKIP_TB=1 to skip formatting (returns '') when many analyses
+    are expected to fail in bulk.
+    """
+    if os.environ.get('EDB_SKIP_TB') == '1':
+        return ''
+    return traceback.format_exc()
 
 
 def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
@@ -29,27 +49,17 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
             'traceback': str (detailed traceback if failed)
         }
     """
-    try:
-        # Import pyedb
-        try:
-            import pyedb
-        except ImportError as e:
-            return {
-                'success': False,
-                'error': f'Failed to import pyedb: {str(e)}',
-                'traceback': traceback.format_exc()
-            }
+    global _PYEDB
 
-        # Validate paths
+    try:
+        # Validate paths (before importing pyedb so invalid input fails fast)
         aedb_path = Path(aedb_path)
         output_path = Path(output_path)
+        aedb_str = os.fspath(aedb_path)
+        output_str = os.fspath(output_path)
 
         # Handle both .aedb folder and edb.def file paths
-        if aedb_path.name == 'edb.def':
-            edb_file = str(aedb_path)
-        elif aedb_path.suffix == '.aedb':
-            edb_file = str(aedb_path)
-        else:
+        if not aedb_str.endswith(_EDB_PATH_SUFFIXES) and aedb_str != 'edb.def':
             return {
                 'success': False,
                 'error': f'Invalid EDB path: {aedb_path}'
@@ -57,18 +67,30 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
 
         # Ensure output directory exists
         output_dir = output_path.parent
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir_str = ensure_dir(output_dir)
 
-        logger.info(f"Opening EDB: {edb_file}")
+        # Import pyedb (cached at module level after the first call)
+        if _PYEDB is None:
+            try:
+                import pyedb as _PYEDB
+            except ImportError as e:
+                return {
+                    'success': False,
+                    'error': f'Failed to import pyedb: {str(e)}',
+                    'traceback': _format_traceback()
+                }
+        pyedb = _PYEDB
+
+        logger.info(f"Opening EDB: {aedb_str}")
         logger.info(f"EDB Version: {edb_version}")
         logger.info(f"gRPC Mode: {grpc}")
-        logger.info(f"Output Path: {output_path}")
+        logger.info(f"Output Path: {output_str}")
         logger.info(f"Output Directory: {output_dir}")
         logger.info("")
 
         # Open EDB using pyedb (matches pattern from other edb files)
         edb = pyedb.Edb(
-            edbpath=str(aedb_path),
+            edbpath=aedb_str,
             version=edb_version,
             grpc=grpc
         )
@@ -87,7 +109,7 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
         # Create execution file with SYZ options
         # Use output directory (Results/Analysis/{cut_name}) for touchstone export
         # SIwave will auto-generate the .snp file in this directory
-        touchstone_export_path = str(output_dir)
+        touchstone_export_path = output_dir_str
         logger.info("Creating SIwave execution file with SYZ...")
         logger.info(f"Touchstone export path: {touchstone_export_path}")
         exec_file = edb.siwave.create_exec_file(
@@ -102,7 +124,6 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
         logger.info("Running SIwave solver...")
         try:
             from pyedb.generic.process import SiwaveSolve
-            import os
 
             solver = SiwaveSolve(edb)
             result = solver.solve()
@@ -121,30 +142,28 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
         logger.info("[OK] EDB closed")
 
         # Check if output file was created
+        # Fast path: SIwave wrote the exact requested file name
+        if output_path.exists():
+            return {
+                'success': True,
+                'output_file': output_str,
+                'file_size': output_path.stat().st_size
+            }
+
         # SIwave auto-determines the extension based on port count (.s2p, .s4p, etc.)
         # So we need to check for any .s*p file in the output directory
-        output_dir = output_path.parent
         output_name_stem = output_path.stem
 
-        # Look for generated Touchstone files
-        touchstone_files = list(output_dir.glob(f"{output_name_stem}.s*p"))
+        # Look for the generated Touchstone file ({stem}.s<N>p)
+        generated_file = find_touchstone_file(output_dir, output_name_stem)
 
-        if not touchstone_files:
-            # Check if file exists with exact path (might have .snp extension)
-            if output_path.exists():
-                return {
-                    'success': True,
-                    'output_file': str(output_path),
-                    'file_size': output_path.stat().st_size
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': f'Touchstone file not generated. Expected: {output_path} or {output_name_stem}.s*p'
-                }
+        if generated_file is None:
+            return {
+                'success': False,
+                'error': f'Touchstone file not generated. Expected: {output_path} or {output_name_stem}.s*p'
+            }
 
         # Return the first (should be only one) generated file
-        generated_file = touchstone_files[0]
         file_size = generated_file.stat().st_size
 
         logger.info(f"[OK] Analysis complete!")
@@ -154,15 +173,16 @@ def run_siwave_analysis(aedb_path, edb_version, output_path, grpc=False):
 
         return {
             'success': True,
-            'output_file': str(generated_file),
+            'output_file': os.fspath(generated_file),
             'file_size': file_size
         }
 
     except Exception as e:
         error_msg = f"Analysis failed: {str(e)}"
-        error_traceback = traceback.format_exc()
+        error_traceback = _format_traceback()
         logger.error(f"\n[ERROR] {error_msg}")
-        logger.error(error_traceback)
+        if error_traceback:
+            logger.error(error_traceback)
         return {
             'success': False,
             'error': error_msg,
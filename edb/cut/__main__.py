@@ -4,13 +4,141 @@ Entry point for running edb.cut package as a module: python -m edb.cut
 This script is run as a subprocess to execute EDB cutting operations.
 It loads cut data and calls the edb_cut_interface module.
 """
+import functools
+import os
 import sys
 import json
+import multiprocessing
 import shutil
-from pathlib import Path
-from .edb_cut_interface import clone_edbs_for_cuts, execute_cuts_on_clone
-from .edb_manager import get_edb_folder_name, load_sss_files
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from itertools import pairwise
+from os.path import basename, splitext
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+# Import from edb_manager directly: edb_cut_interface also loads net_port_handler,
+# which execute_cuts_on_clone imports on demand inside the clone workers
+from .edb_manager import (
+    _import_pyedb,
+    clone_edbs_for_cuts,
+    execute_cuts_on_clone,
+    get_edb_folder_name,
+    load_sss_files,
+)
+from config import CUT_EXIT_ABORTED, CUT_WORKER_RESULT_PREFIX, CUT_WORKER_SERVER_FLAG, get_sss_dir
+from util.json_utils import loads as _loads, load_json_file
 from util.logger_module import logger, log_exception
+from .clone_worker import _CUT_DEBUG, _DASH, _cut_stem, _log_lines, _process_clone, _run_clone
+
+# Set EDB_CUT_FAIL_FAST=1 to skip the remaining clones after the first failed one
+_FAIL_FAST = os.environ.get('EDB_CUT_FAIL_FAST') == '1'
+
+# Set EDB_CUT_PARALLEL=0 to process clones serially in this process (e.g. for debugging)
+_PARALLEL = os.environ.get('EDB_CUT_PARALLEL', '1') != '0'
+
+# Start method for the clone process pool (the only one available on Windows)
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+# Banner rule for job sections of the log
+_BAR = "=" * 70
+
+
+def _default_max_jobs():
+    """
+    Default cap on parallel clone workers.
+
+    EDB_CUT_PARALLELISM overrides the CPU count, e.g. to limit the number of
+    simultaneous EDB sessions checking out licenses.
+
+    Returns:
+        int: Max parallel clone workers (at least 1)
+    """
+    parallelism = os.environ.get('EDB_CUT_PARALLELISM', '').strip()
+    if parallelism.isdigit() and int(parallelism) > 0:
+        return int(parallelism)
+    return os.cpu_count() or 1
+
+
+# pyedb gRPC mode requires AEDT 2025.2 or newer
+_GRPC_MIN_VERSION = (2025, 2)
+
+
+def _auto_grpc(grpc, num_clones, edb_version):
+    """
+    Resolve the gRPC mode, enabling it automatically for multi-clone runs.
+
+    An explicit True/False from the GUI or command line is always kept; only an
+    unspecified mode (None) is auto-enabled, and only for AEDT versions that
+    support gRPC. Set EDB_DISABLE_GRPC_AUTO=1 to never auto-enable.
+
+    Args:
+        grpc: Requested gRPC mode (None if not specified)
+        num_clones: Number of clones to process
+        edb_version: AEDT version string (e.g., "2025.1")
+
+    Returns:
+        bool: gRPC mode to use for cloning and cut execution
+    """
+    if grpc is not None:
+        return bool(grpc)
+    if num_clones <= 1 or os.environ.get('EDB_DISABLE_GRPC_AUTO') == '1':
+        return False
+    try:
+        version = tuple(int(part) for part in str(edb_version).split('.')[:2])
+    except ValueError:
+        return False
+    if version < _GRPC_MIN_VERSION:
+        return False
+    logger.info(f"Auto-enabled gRPC mode for {num_clones} clones")
+    return True
+
+
+class BatchManifest(NamedTuple):
+    """Batch input file contents, validated and defaulted once"""
+    cut_files: list
+    selected_nets: dict
+    use_stackup: bool
+    cut_type: Optional[str]
+
+
+def parse_batch_manifest(input_data):
+    """
+    Validate a batch input file and fill in defaults.
+
+    selected_nets always gets 'signal' and 'power' lists; other keys
+    (e.g. 'reference_layer') are kept as-is.
+
+    Args:
+        input_data: Parsed batch JSON ({'mode': 'batch', 'cut_files': [...], ...})
+
+    Returns:
+        BatchManifest: Validated manifest
+
+    Raises:
+        ValueError: If cut_files or selected_nets have the wrong shape
+    """
+    cut_files = input_data.get('cut_files') or []
+    if not isinstance(cut_files, list) or not all(isinstance(f, str) for f in cut_files):
+        raise ValueError("Batch 'cut_files' must be a list of file paths")
+
+    raw_nets = input_data.get('selected_nets') or {}
+    if not isinstance(raw_nets, dict):
+        raise ValueError("Batch 'selected_nets' must be an object")
+    selected_nets = {**raw_nets, 'signal': raw_nets.get('signal') or [], 'power': raw_nets.get('power') or []}
+
+    return BatchManifest(
+        cut_files=cut_files,
+        selected_nets=selected_nets,
+        # Default True for backward compatibility with batch files without the flag
+        use_stackup=bool(input_data.get('use_stackup', True)),
+        cut_type=input_data.get('type') or None,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _load_cut_cached(path_str, mtime_ns):
+    """Parse a cut file; mtime_ns is part of the cache key so rewritten files are reloaded"""
+    return load_json_file(path_str)
 
 
 def load_cut_data(cut_file_path):
@@ -21,89 +149,245 @@ def load_cut_data(cut_file_path):
         cut_file_path: Path to cut JSON file
 
     Returns:
-        dict: Cut data dictionary
+        dict: Cut data dictionary (cached; treat as read-only)
 
     Raises:
         FileNotFoundError: If cut file doesn't exist
         json.JSONDecodeError: If JSON parsing fails
     """
-    cut_path = Path(cut_file_path)
+    cut_path = os.path.realpath(cut_file_path)
 
-    if not cut_path.exists():
-        raise FileNotFoundError(f"Cut file not found: {cut_file_path}")
+    # One stat call serves as both the existence check and the cache key
+    try:
+        mtime_ns = os.stat(cut_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cut file not found: {cut_file_path}") from None
 
-    with open(cut_path, 'r', encoding='utf-8') as f:
-        cut_data = json.load(f)
+    # The cached dict is shared; callers that add keys merge into a shallow copy
+    return _load_cut_cached(cut_path, mtime_ns)
 
-    return cut_data
 
+class SssContext(NamedTuple):
+    """Stackup inputs taken from the latest SSS files of an EDB"""
+    edb_folder_name: str
+    excel_file_path: Optional[str]
+    excel_exists: bool
+    cut_section_mapping: dict
+    cut_layer_data: dict
 
-if __name__ == "__main__":
+
+def _load_sss_context(edb_path):
     """
-    Main entry point for subprocess.
+    Load the stackup inputs from source/{edb_folder_name}/sss/.
 
-    Expected command line arguments:
-        sys.argv[1]: edb_path (path to .aedb folder or edb.def file)
-        sys.argv[2]: edb_version (e.g., "2025.1")
-        sys.argv[3]: cut_file_path (path to cut JSON file or batch JSON file)
-        sys.argv[4]: grpc (optional, "True" or "False", default: "False")
+    Shared by batch and single mode. SSS files are parsed through the
+    mtime-keyed cache in load_sss_files, so repeated jobs on the same EDB
+    skip the JSON parse.
+
+    Args:
+        edb_path: Path to .aedb folder or edb.def file
+
+    Returns:
+        SssContext: Stackup inputs, or None if the SSS files are missing or unreadable
     """
-    if len(sys.argv) < 4:
-        logger.info("[ERROR] Insufficient arguments")
-        logger.info("Usage: python -m edb.cut <edb_path> <edb_version> <cut_file_path> [grpc]")
-        sys.exit(1)
+    edb_folder_name = get_edb_folder_name(edb_path)
+    sss_result = load_sss_files(get_sss_dir(edb_folder_name))
+    if not sss_result['success']:
+        logger.info("")
+        return None
+
+    sections_data = sss_result['sections_data']
+    layers_data = sss_result['layers_data']
+    excel_file_path = sections_data.get('excel_file')
+    return SssContext(
+        edb_folder_name=edb_folder_name,
+        excel_file_path=excel_file_path,
+        excel_exists=bool(excel_file_path) and os.path.exists(excel_file_path),
+        cut_section_mapping=sections_data.get('cut_section_mapping', {}),
+        cut_layer_data=layers_data.get('cut_layer_data', {}),
+    )
+
+
+@functools.cache
+def _import_stackup_generator():
+    """Import the SSS stackup XML generator on first use (jobs without SSS data never load it)."""
+    from stackup.generate_stackup import generate_xml_stackup_from_sss
+    return generate_xml_stackup_from_sss
+
+
+def _generate_stackup_xmls(edb_path, results_dir, cut_ids=None):
+    """
+    Generate one stackup XML per cut from the latest SSS files of an EDB.
+
+    Shared by batch and single mode. Failures are logged as warnings and
+    yield no XMLs, so cutting continues with the original stackup.
+
+    Args:
+        edb_path: Path to .aedb folder or edb.def file
+        results_dir: Directory the XML files are written to
+        cut_ids: Cut IDs to generate XMLs for (default: every cut in the
+                 SSS section mapping)
+
+    Returns:
+        dict: {cut_id: xml_path} for the cuts with SSS layer data
+    """
+    stackup_xml_paths = {}
+    try:
+        sss_context = _load_sss_context(edb_path)
+        if sss_context is None:
+            return stackup_xml_paths
+
+        edb_folder_name, excel_file_path, excel_exists, cut_section_mapping, cut_layer_data = sss_context
+        if cut_ids is None:
+            cut_ids = cut_section_mapping
+        cut_ids = [cut_id for cut_id in cut_ids if cut_id in cut_layer_data]
+
+        if not excel_exists or not cut_ids:
+            if not excel_exists:
+                logger.info("Excel file not found in sss data, skipping stackup generation")
+            else:
+                logger.info("No cut layer data found in sss files, skipping stackup generation")
+            logger.info("")
+            return stackup_xml_paths
+
+        logger.info(f"Excel file: {excel_file_path}")
+        logger.info("Generating stackup XML files for each cut...")
+
+        generate_xml_stackup_from_sss = _import_stackup_generator()
+
+        edb_stem = splitext(edb_folder_name)[0]
+        for cut_id in cut_ids:
+            xml_filename = f"{edb_stem}_{cut_id}_stackup.xml"
+            stackup_xml_path = os.path.join(results_dir, xml_filename)
+
+            # Generate XML for this specific cut (only its layers)
+            generate_xml_stackup_from_sss(cut_layer_data[cut_id], stackup_xml_path, excel_file_path)
+
+            stackup_xml_paths[cut_id] = stackup_xml_path
+            section_name = cut_section_mapping.get(cut_id, 'unknown')
+            logger.info(f"  Stackup XML for {cut_id} ({section_name}): {xml_filename}")
+
+        logger.info(f"Generated {len(stackup_xml_paths)} stackup XML files")
+        logger.info("")
+
+    except Exception as stackup_error:
+        log_exception("stackup XML generation", stackup_error, level="warning")
+        logger.info("")
+
+    return stackup_xml_paths
+
+
+def _preload_cut_data(cut_files):
+    """
+    Start loading cut files on background threads.
 
-    edb_path = sys.argv[1]
-    edb_version = sys.argv[2]
-    input_file_path = sys.argv[3]
-    grpc = sys.argv[4].lower() == 'true' if len(sys.argv) > 4 else False
+    shutdown(wait=False) lets queued loads finish but releases the threads
+    afterwards, even when the caller returns early (e.g. cloning fails).
+    A single cut file has nothing to overlap with and is parsed inline.
+    Duplicate paths are submitted once. Load errors are stored in the futures,
+    so the caller can fail only the clones that use the bad file.
 
-    logger.info("=" * 70)
-    logger.info("EDB Cascade Subprocess")
-    logger.info("=" * 70)
-    logger.info(f"EDB Path: {edb_path}")
-    logger.info(f"EDB Version: {edb_version}")
-    logger.info(f"Input File: {input_file_path}")
-    logger.info(f"gRPC Mode: {grpc}")
-    logger.info("")
+    Args:
+        cut_files: List of cut JSON file paths
+
+    Returns:
+        list: Futures resolving to cut data, in cut_files order
+    """
+    if len(cut_files) == 1:
+        future = Future()
+        try:
+            future.set_result(load_cut_data(cut_files[0]))
+        except Exception as e:
+            future.set_exception(e)
+        return [future]
+
+    # A path listed more than once is read once; its entries share the future
+    unique_files = dict.fromkeys(cut_files)
+    executor = ThreadPoolExecutor(max_workers=min(len(unique_files), 16))
+    for cut_file in unique_files:
+        unique_files[cut_file] = executor.submit(load_cut_data, cut_file)
+    executor.shutdown(wait=False)
+    return [unique_files[cut_file] for cut_file in cut_files]
+
+
+def run_cut_job(edb_path, edb_version, input_file_path, grpc=None, max_jobs=None):
+    """
+    Run one cut job (batch or single mode) described by an input JSON file.
+
+    Args:
+        edb_path: Path to .aedb folder or edb.def file
+        edb_version: AEDT version string (e.g., "2025.1")
+        input_file_path: Path to cut JSON file or batch JSON file
+        grpc: Use gRPC mode; None lets multi-clone runs auto-enable it (see _auto_grpc)
+        max_jobs: Max parallel clone workers (default: EDB_CUT_PARALLELISM or CPU count)
+
+    Returns:
+        int: Process exit code (0 on success, 1 on failure,
+             CUT_EXIT_ABORTED if EDB_CUT_FAIL_FAST=1 skipped remaining clones)
+    """
+    _log_lines(
+        _BAR,
+        "EDB Cascade Subprocess",
+        _BAR,
+        f"EDB Path: {edb_path}",
+        f"EDB Version: {edb_version}",
+        f"Input File: {input_file_path}",
+        f"gRPC Mode: {'auto' if grpc is None else grpc}",
+        f"Max Jobs: {max_jobs or 'auto'}",
+        "",
+    )
 
     try:
-        # Load input file to detect mode
+        # Load input file to detect mode. Batch manifests only list cut file paths
+        # and net names (geometry lives in the cut files), so one full parse is cheap.
         logger.info("Loading input file...")
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            input_data = json.load(f)
+        input_data = load_json_file(input_file_path)
 
         # Check if batch mode
         is_batch = input_data.get('mode') == 'batch'
 
         if is_batch:
             # Batch mode: multiple cuts
-            cut_files = input_data.get('cut_files', [])
+            try:
+                manifest = parse_batch_manifest(input_data)
+            except ValueError as e:
+                logger.info(f"[ERROR] Invalid batch file: {e}")
+                return 1
+
+            cut_files = manifest.cut_files
             if not cut_files:
                 logger.info("[ERROR] No cut files in batch")
-                sys.exit(1)
-
-            # Get selected nets from batch data
-            selected_nets = input_data.get('selected_nets', {'signal': [], 'power': []})
+                return 1
 
-            # Get stackup usage flag (default: True for backward compatibility)
-            use_stackup = input_data.get('use_stackup', True)
+            selected_nets = manifest.selected_nets
+            use_stackup = manifest.use_stackup
 
             logger.info(f"[BATCH MODE] Processing {len(cut_files)} cuts")
             logger.info(f"Stackup application: {'Enabled' if use_stackup else 'Disabled (user cleared SSS file)'}")
-            logger.debug(f"Batch selected_nets from file: {selected_nets}")
-            logger.debug(f"Signal nets count: {len(selected_nets.get('signal', []))}")
-            logger.debug(f"Power nets count: {len(selected_nets.get('power', []))}")
-            if selected_nets.get('signal'):
+            logger.debug("Batch selected_nets from file: %s", selected_nets)
+            logger.debug("Signal nets count: %d", len(selected_nets['signal']))
+            logger.debug("Power nets count: %d", len(selected_nets['power']))
+            if selected_nets['signal']:
                 logger.info(f"Selected signal nets: {', '.join(selected_nets['signal'])}")
             else:
                 logger.info("No signal nets selected")
             logger.info("")
 
-            # Determine cut type from first cut file
-            first_cut_data = load_cut_data(cut_files[0])
-            cut_type = first_cut_data.get('type', 'polyline')
-            logger.info(f"Cut type detected: {cut_type}")
+            # Parse cut files in the background so the reads overlap EDB cloning
+            cut_data_futures = _preload_cut_data(cut_files)
+
+            # Cut type comes from the manifest when the producer recorded it;
+            # otherwise wait for the first cut file and read it from there
+            cut_type = manifest.cut_type
+            if cut_type:
+                logger.info(f"Cut type (from batch file): {cut_type}")
+            else:
+                try:
+                    cut_type = cut_data_futures[0].result().get('type', 'polyline')
+                except Exception as e:
+                    logger.info(f"[ERROR] Failed to load cut file {basename(cut_files[0])}: {e}")
+                    return 1
+                logger.info(f"Cut type detected: {cut_type}")
 
             # Clone EDB files before processing cuts
             # Polygon/Rectangle: n cuts = n clones (each cut defines a region)
@@ -114,6 +398,7 @@ if __name__ == "__main__":
             else:
                 num_clones = len(cut_files) + 1
                 logger.info(f"Creating {num_clones} EDB clones ({len(cut_files)} cuts + 1 segments)...")
+            grpc = _auto_grpc(grpc, num_clones, edb_version)
             logger.info("")
 
             try:
@@ -121,192 +406,169 @@ if __name__ == "__main__":
                 logger.info(f"Successfully created {len(cloned_paths)} EDB clones")
                 logger.info("")
 
-                # Copy batch file to Results directory
-                results_dir = Path(cloned_paths[0]).parent
-                batch_filename = f"batch_{Path(input_file_path).name}"
-                batch_dest = results_dir / batch_filename
-
-                try:
-                    shutil.copy2(input_file_path, batch_dest)
-                    logger.info(f"Batch file copied to: {batch_dest}")
-                    logger.info("")
-                except Exception as copy_error:
-                    logger.warning(f"Failed to copy batch file: {copy_error}")
-                    logger.info("")
-
-                # Generate stackup XMLs from sss files (one per cut)
-                stackup_xml_paths = {}  # {cut_id: xml_path}
-
-                # Only process stackup if use_stackup flag is True
+                # Copy batch file to Results directory on a background thread;
+                # the copy overlaps stackup generation and is checked before
+                # the clones are processed
+                results_dir = os.path.dirname(cloned_paths[0])
+                batch_dest = os.path.join(results_dir, f"batch_{basename(input_file_path)}")
+                copy_executor = ThreadPoolExecutor(max_workers=1)
+                batch_copy = copy_executor.submit(shutil.copy2, input_file_path, batch_dest)
+                copy_executor.shutdown(wait=False)
+
+                # Generate stackup XMLs from sss files (one per cut), unless the
+                # user cleared the SSS file selection
                 if use_stackup:
-                    try:
-                        # Extract EDB folder name from path
-                        edb_folder_name = get_edb_folder_name(edb_path)
-
-                        # Find sss files in source/{edb_folder_name}/sss/
-                        sss_dir = Path('source') / edb_folder_name / 'sss'
-
-                        # Load SSS files (sections and layers)
-                        sss_result = load_sss_files(sss_dir)
-
-                        if sss_result['success']:
-                            sections_data = sss_result['sections_data']
-                            layers_data = sss_result['layers_data']
-                            excel_file_path = sections_data.get('excel_file')
-                            cut_section_mapping = sections_data.get('cut_section_mapping', {})
-                            cut_layer_data = layers_data.get('cut_layer_data', {})
-
-                            if excel_file_path and Path(excel_file_path).exists() and cut_layer_data:
-                                logger.info(f"Excel file: {excel_file_path}")
-                                logger.info("Generating stackup XML files for each cut...")
-
-                                # Import generate_stackup module
-                                from stackup.generate_stackup import generate_xml_stackup_from_sss
-
-                                # Generate separate stackup XML for EACH cut
-                                for cut_id, section_name in cut_section_mapping.items():
-                                    if cut_id in cut_layer_data:
-                                        xml_filename = f"{Path(edb_folder_name).stem}_{cut_id}_stackup.xml"
-                                        stackup_xml_path = results_dir / xml_filename
-
-                                        # Generate XML for this specific cut
-                                        generate_xml_stackup_from_sss(
-                                            cut_layer_data[cut_id],  # Only layers for this cut
-                                            str(stackup_xml_path),
-                                            excel_file_path
-                                        )
-
-                                        stackup_xml_paths[cut_id] = str(stackup_xml_path)
-                                        logger.info(f"  Stackup XML for {cut_id} ({section_name}): {stackup_xml_path.name}")
-
-                                logger.info(f"Generated {len(stackup_xml_paths)} stackup XML files")
-                                logger.info("")
-                            else:
-                                if not excel_file_path or not Path(excel_file_path).exists():
-                                    logger.info("Excel file not found in sss data, skipping stackup generation")
-                                if not cut_layer_data:
-                                    logger.info("No cut layer data found in sss files, skipping stackup generation")
-                                logger.info("")
-                        else:
-                            logger.info("")
-
-                    except Exception as stackup_error:
-                        log_exception("stackup XML generation", stackup_error, level="warning")
-                        logger.info("")
+                    stackup_xml_paths = _generate_stackup_xmls(edb_path, results_dir)
                 else:
+                    stackup_xml_paths = {}
                     logger.info("Stackup application disabled by user (SSS file selection cleared)")
                     logger.info("")
 
             except Exception as clone_error:
                 log_exception("EDB cloning", clone_error)
-                sys.exit(1)
+                return 1
+
+            # Collect the cut data parsed in the background during cloning. A cut
+            # file that failed to load only fails the clones that use it
+            cut_data_cache = {}
+            bad_cut_files = set()
+            for cut_file, future in zip(cut_files, cut_data_futures):
+                if cut_file in cut_data_cache or cut_file in bad_cut_files:
+                    continue
+                try:
+                    cut_data_cache[cut_file] = future.result()
+                except Exception as load_error:
+                    logger.error(f"Failed to load cut file {basename(cut_file)}: {load_error}")
+                    bad_cut_files.add(cut_file)
 
             # Build clone-to-cut mapping
             logger.info("Building clone-to-cut mapping...")
-            clone_cut_mapping = []
-
             if cut_type in ['polygon', 'rectangle']:
                 # Polygon: 1:1 mapping (each clone gets one polygon region)
-                for i in range(num_clones):
-                    clone_cut_mapping.append([cut_files[i]])
-                    logger.info(f"  Clone {i+1}: {Path(cut_files[i]).stem} (polygon region {i+1})")
+                clone_cut_mapping = [[cut_file] for cut_file in cut_files]
             else:
-                # Polyline: first and last clones get 1 cut, middle clones get 2 adjacent cuts
-                for i in range(num_clones):
-                    if i == 0:
-                        # First clone: only first cut
-                        clone_cut_mapping.append([cut_files[0]])
-                        logger.info(f"  Clone {i+1}: {Path(cut_files[0]).stem}")
-                    elif i == num_clones - 1:
-                        # Last clone: only last cut
-                        clone_cut_mapping.append([cut_files[-1]])
-                        logger.info(f"  Clone {i+1}: {Path(cut_files[-1]).stem}")
-                    else:
-                        # Middle clones: adjacent cuts [i-1, i]
-                        clone_cut_mapping.append([cut_files[i-1], cut_files[i]])
-                        logger.info(f"  Clone {i+1}: {Path(cut_files[i-1]).stem}, {Path(cut_files[i]).stem}")
+                # Polyline: first and last clones get 1 cut, middle clones get 2 adjacent cuts [i-1, i]
+                clone_cut_mapping = (
+                    [[cut_files[0]]]
+                    + [list(adjacent_cuts) for adjacent_cuts in pairwise(cut_files)]
+                    + [[cut_files[-1]]]
+                )
+            logger.info(f"Mapped {len(cut_files)} cuts onto {len(clone_cut_mapping)} clones")
+            # Cut IDs (file stems) per clone, derived once for logging and stackup lookup
+            stems = {cut_file: _cut_stem(cut_file) for cut_file in cut_files}
+            clone_cut_ids = [[stems[f] for f in assigned_cut_files] for assigned_cut_files in clone_cut_mapping]
+            if _CUT_DEBUG:
+                logger.debug("Clone-to-cut mapping:\n" + "\n".join(
+                    f"  Clone {i}: {', '.join(assigned_cut_ids)}"
+                    for i, assigned_cut_ids in enumerate(clone_cut_ids, 1)
+                ))
             logger.info("")
 
-            all_success = True
-            failed_cuts = []
-
-            # Process each clone with its assigned cuts
-            for i, (clone_path, assigned_cut_files) in enumerate(zip(cloned_paths, clone_cut_mapping), 1):
-                logger.info("-" * 70)
-                logger.info(f"Processing Clone {i}/{num_clones}: {Path(clone_path).name}")
-                logger.info(f"Assigned cuts: {', '.join([Path(f).stem for f in assigned_cut_files])}")
-                logger.info("-" * 70)
-
-                # Get edb.def path for this clone
-                clone_edb_path = str(Path(clone_path) / 'edb.def')
+            # Process clones in parallel (each clone is an independent .aedb directory)
+            clone_edb_paths = [os.path.join(clone_path, 'edb.def') for clone_path in cloned_paths]
+            # First position of each cut file in the global sequence (as list.index would give)
+            cut_index = {}
+            for k, cut_file in enumerate(cut_files):
+                cut_index.setdefault(cut_file, k)
+            clone_args = []
+            # Clones whose cut files failed to load: (index, False, failed_cut_labels)
+            preload_failures = []
+            for i, (clone_path, clone_edb_path, assigned_cut_files, assigned_cut_ids) in enumerate(
+                    zip(cloned_paths, clone_edb_paths, clone_cut_mapping, clone_cut_ids), 1):
+                first_cut_index = cut_index[assigned_cut_files[0]]
+                previous_cut_file = cut_files[first_cut_index - 1] if first_cut_index > 0 else None
+                if bad_cut_files.intersection((*assigned_cut_files, previous_cut_file)):
+                    logger.error(f"Skipping clone {i}: a cut file it needs failed to load")
+                    preload_failures.append(
+                        (i, False, [f"{cut_id} (clone {i})" for cut_id in assigned_cut_ids])
+                    )
+                    continue
+                # Ship only the cut data this clone needs to its worker process
+                clone_cut_data = {cut_file: cut_data_cache[cut_file] for cut_file in assigned_cut_files}
+                if previous_cut_file is not None:
+                    clone_cut_data[previous_cut_file] = cut_data_cache[previous_cut_file]
+                clone_args.append(
+                    (i, num_clones, clone_path, clone_edb_path, assigned_cut_files, assigned_cut_ids,
+                     clone_cut_data, previous_cut_file, selected_nets, stackup_xml_paths,
+                     edb_version, grpc)
+                )
+            # Finish the batch file copy before worker processes are started
+            try:
+                batch_copy.result()
+                logger.info(f"Batch file copied to: {batch_dest}")
+            except Exception as copy_error:
+                logger.warning(f"Failed to copy batch file: {copy_error}")
 
-                try:
-                    # Load all cut data for this clone
-                    cut_data_list = []
-                    for cut_file_path in assigned_cut_files:
-                        cut_data = load_cut_data(cut_file_path)
-                        # Add selected nets to cut data
-                        cut_data['selected_nets'] = selected_nets
-                        logger.debug(f"Added selected_nets to cut {cut_data.get('id', 'unknown')}: {cut_data['selected_nets']}")
-                        cut_data_list.append(cut_data)
-
-                    # Select appropriate stackup XML for this clone
-                    # Use first cut's stackup (temporary solution until execute_cuts_on_clone supports per-cut stackup)
-                    clone_stackup_path = None
-                    if stackup_xml_paths and len(assigned_cut_files) > 0:
-                        first_cut_id = Path(assigned_cut_files[0]).stem
-                        clone_stackup_path = stackup_xml_paths.get(first_cut_id)
-
-                        if len(assigned_cut_files) > 1:
-                            logger.warning(f"Clone has {len(assigned_cut_files)} cuts, using {first_cut_id} stackup XML")
-                            logger.warning("Future enhancement: Pass separate stackup XML for each cut")
-
-                    # Find previous cut in global sequence for proximity-based port sorting
-                    previous_cut_points = None
-                    if len(assigned_cut_files) > 0:
-                        # Get index of first cut in this clone within global cut_files list
-                        first_cut_path = assigned_cut_files[0]
-                        try:
-                            current_cut_index = cut_files.index(first_cut_path)
-                            if current_cut_index > 0:
-                                # Load previous cut's data to get polygon points
-                                prev_cut_path = cut_files[current_cut_index - 1]
-                                prev_cut_data = load_cut_data(prev_cut_path)
-                                previous_cut_points = prev_cut_data.get('points', [])
-                                logger.info(f"Found previous cut in sequence: {Path(prev_cut_path).stem}")
-                                logger.info(f"Previous cut has {len(previous_cut_points)} polygon points")
-                        except ValueError:
-                            logger.warning(f"Could not find {Path(first_cut_path).stem} in global cut sequence")
-
-                    # Execute all cuts on this clone (opens EDB once, processes all cuts, closes EDB)
-                    success = execute_cuts_on_clone(clone_edb_path, edb_version, cut_data_list, grpc, clone_stackup_path, previous_cut_points)
+            if _FAIL_FAST and preload_failures:
+                # Fail-fast: a clone has already failed, so none are started
+                clone_args = []
 
-                    if success:
-                        logger.info(f"All cuts completed successfully on clone {i}")
-                    else:
-                        logger.error(f"Some cuts failed on clone {i}")
-                        all_success = False
-                        for cut_data in cut_data_list:
-                            failed_cuts.append(f"{cut_data.get('id', 'unknown')} (clone {i})")
+            max_workers = min(len(clone_args), max_jobs or _default_max_jobs()) if _PARALLEL else 1
+            logger.info(f"Processing {len(clone_args)} clones with {max_workers} worker(s)")
+            logger.info("")
 
-                except Exception as clone_error:
-                    logger.error(f"Failed to process clone {i}: {clone_error}")
+            if max_workers > 1:
+                # spawn, not the Linux default fork: the cut worker may already have
+                # pyedb's .NET runtime and gRPC channels loaded, which are not fork-safe
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=_POOL_CONTEXT) as executor:
+                    futures = [executor.submit(_process_clone, args) for args in clone_args]
+                    if _FAIL_FAST:
+                        for future in as_completed(futures):
+                            if future.exception() is not None or not future.result()[1]:
+                                # Clones already running finish; queued ones are dropped
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                break
+                # Leaving the with block waits for every future that was not cancelled
+                clone_results = []
+                for args, future in zip(clone_args, futures):
+                    if future.cancelled():
+                        continue
+                    try:
+                        clone_results.append(future.result())
+                    except BrokenProcessPool as pool_error:
+                        # A worker process died or could not start; _run_clone handles
+                        # every other error itself, so only the pool can fail here
+                        i, assigned_cut_ids = args[0], args[5]
+                        logger.error(f"Clone {i} worker process failed: {pool_error}")
+                        clone_results.append((i, False, [f"{cut_id} (clone {i})" for cut_id in assigned_cut_ids]))
+            else:
+                clone_results = []
+                for args in clone_args:
+                    # Nothing runs alongside this clone, so its output stays unbuffered
+                    clone_results.append(_run_clone(*args))
+                    if _FAIL_FAST and not clone_results[-1][1]:
+                        break
+
+            # Fewer results than clones means fail-fast skipped some
+            clone_results = sorted(preload_failures + clone_results)
+            aborted = len(clone_results) < num_clones
+            all_success = True
+            failed_cuts = []
+            for i, success, clone_failed_cuts in clone_results:
+                if not success:
                     all_success = False
-                    for cut_file_path in assigned_cut_files:
-                        failed_cuts.append(f"{Path(cut_file_path).stem} (clone {i})")
-
-                logger.info("")
+                    failed_cuts.extend(clone_failed_cuts)
 
             # Print final summary
-            logger.info("=" * 70)
+            if aborted:
+                skipped = num_clones - len(clone_results)
+                _log_lines(
+                    _BAR,
+                    f"[ABORTED] Fail-fast: {skipped} clone(s) skipped after a failure",
+                    f"Failed cuts: {', '.join(failed_cuts)}",
+                    _BAR,
+                )
+                return CUT_EXIT_ABORTED
             if all_success:
-                logger.info(f"[SUCCESS] All {len(cut_files)} cuts completed successfully")
+                summary = (f"[SUCCESS] All {len(cut_files)} cuts completed successfully",)
             else:
-                logger.info(f"[PARTIAL SUCCESS] {len(cut_files) - len(failed_cuts)}/{len(cut_files)} cuts completed")
-                logger.info(f"Failed cuts: {', '.join(failed_cuts)}")
-            logger.info("=" * 70)
+                summary = (
+                    f"[PARTIAL SUCCESS] {len(cut_files) - len(failed_cuts)}/{len(cut_files)} cuts completed",
+                    f"Failed cuts: {', '.join(failed_cuts)}",
+                )
+            _log_lines(_BAR, *summary, _BAR)
 
-            sys.exit(0 if all_success else 1)
+            return 0 if all_success else 1
 
         else:
             # Single mode: one cut (input_data is the cut data itself)
@@ -315,9 +577,11 @@ if __name__ == "__main__":
             logger.info(f"[SINGLE MODE] Processing cut: {cut_id}")
             logger.info(f"Cut type: {cut_type}")
 
-            # Add empty selected_nets for single mode (no batch file)
-            if 'selected_nets' not in input_data:
-                input_data['selected_nets'] = {'signal': [], 'power': []}
+            # Add empty selected_nets for single mode (no batch file); both clones
+            # share one read-only view of it
+            input_data['selected_nets'] = MappingProxyType(
+                input_data.get('selected_nets') or {'signal': [], 'power': []}
+            )
             logger.info("")
 
             # Clone EDB files before processing cut
@@ -329,6 +593,7 @@ if __name__ == "__main__":
             else:
                 num_clones = 2
                 logger.info(f"Creating {num_clones} EDB clones (1 cut → 2 segments)...")
+            grpc = _auto_grpc(grpc, num_clones, edb_version)
             logger.info("")
 
             try:
@@ -337,77 +602,25 @@ if __name__ == "__main__":
                 logger.info("")
 
                 # Generate stackup XML from sss file if exists (for single cut)
-                stackup_xml_path = None
-                try:
-                    # Extract EDB folder name from path
-                    edb_folder_name = get_edb_folder_name(edb_path)
-
-                    # Get Results directory
-                    results_dir = Path(cloned_paths[0]).parent
-
-                    # Find sss files in source/{edb_folder_name}/sss/
-                    sss_dir = Path('source') / edb_folder_name / 'sss'
-
-                    # Load SSS files (sections and layers)
-                    sss_result = load_sss_files(sss_dir)
-
-                    if sss_result['success']:
-                        sections_data = sss_result['sections_data']
-                        layers_data = sss_result['layers_data']
-                        excel_file_path = sections_data.get('excel_file')
-                        cut_section_mapping = sections_data.get('cut_section_mapping', {})
-                        cut_layer_data = layers_data.get('cut_layer_data', {})
-
-                        # For single mode, generate stackup for the current cut_id
-                        if excel_file_path and Path(excel_file_path).exists() and cut_id in cut_layer_data:
-                            logger.info(f"Excel file: {excel_file_path}")
-                            section_name = cut_section_mapping.get(cut_id, 'unknown')
-                            logger.info(f"Generating stackup XML for {cut_id} ({section_name})...")
-
-                            # Import generate_stackup module
-                            from stackup.generate_stackup import generate_xml_stackup_from_sss
-
-                            # Generate XML for this specific cut
-                            xml_filename = f"{Path(edb_folder_name).stem}_{cut_id}_stackup.xml"
-                            stackup_xml_path = results_dir / xml_filename
-
-                            generate_xml_stackup_from_sss(
-                                cut_layer_data[cut_id],  # Only layers for this cut
-                                str(stackup_xml_path),
-                                excel_file_path
-                            )
-
-                            logger.info(f"Stackup XML generated: {stackup_xml_path}")
-                            logger.info("")
-                        else:
-                            if not excel_file_path or not Path(excel_file_path).exists():
-                                logger.info("Excel file not found in sss data, skipping stackup generation")
-                            elif cut_id not in cut_layer_data:
-                                logger.info(f"Cut '{cut_id}' not found in layer data, skipping stackup generation")
-                            logger.info("")
-                    else:
-                        logger.info("")
-
-                except Exception as stackup_error:
-                    log_exception("stackup XML generation", stackup_error, level="warning")
-                    logger.info("")
+                results_dir = os.path.dirname(cloned_paths[0])
+                stackup_xml_path = _generate_stackup_xmls(edb_path, results_dir, [cut_id]).get(cut_id)
 
             except Exception as clone_error:
                 log_exception("EDB cloning", clone_error)
-                sys.exit(1)
+                return 1
 
             # Both clones get the same cut (1 cut divides into 2 segments)
             logger.info("Applying cut to both clones...")
             all_success = True
 
-            for i, clone_path in enumerate(cloned_paths, 1):
-                logger.info("-" * 70)
-                logger.info(f"Processing Clone {i}/{num_clones}: {Path(clone_path).name}")
-                logger.info(f"Assigned cut: {cut_id}")
-                logger.info("-" * 70)
-
-                # Get edb.def path for this clone
-                clone_edb_path = str(Path(clone_path) / 'edb.def')
+            clone_edb_paths = [os.path.join(clone_path, 'edb.def') for clone_path in cloned_paths]
+            for i, (clone_path, clone_edb_path) in enumerate(zip(cloned_paths, clone_edb_paths), 1):
+                _log_lines(
+                    _DASH,
+                    f"Processing Clone {i}/{num_clones}: {basename(clone_path)}",
+                    f"Assigned cut: {cut_id}",
+                    _DASH,
+                )
 
                 try:
                     # Execute cutting operation on THIS CLONE (opens EDB once, processes cut, closes EDB)
@@ -426,23 +639,104 @@ if __name__ == "__main__":
                 logger.info("")
 
             if all_success:
-                logger.info("=" * 70)
-                logger.info("[SUCCESS] EDB cutting operation completed on all clones")
-                logger.info("=" * 70)
-                sys.exit(0)
+                summary = "[SUCCESS] EDB cutting operation completed on all clones"
             else:
-                logger.info("=" * 70)
-                logger.info("[ERROR] EDB cutting operation failed on one or more clones")
-                logger.info("=" * 70)
-                sys.exit(1)
+                summary = "[ERROR] EDB cutting operation failed on one or more clones"
+            _log_lines(_BAR, summary, _BAR)
+
+            return 0 if all_success else 1
 
     except FileNotFoundError as e:
         logger.info(f"\n[ERROR] {e}")
-        sys.exit(1)
+        return 1
     except json.JSONDecodeError as e:
         logger.info(f"\n[ERROR] Failed to parse input file: {e}")
-        sys.exit(1)
+        return 1
     except Exception as e:
         logger.info(f"\n[ERROR] Unexpected error: {e}")
         log_exception("Unexpected error in main")
-        sys.exit(1)
\ No newline at end of file
+        return 1
+
+
+def _serve_loop():
+    """
+    Serve cut jobs from stdin until EOF (persistent worker mode).
+
+    Each request is one JSON line:
+        {"edb_path": ..., "edb_version": ..., "input_file": ..., "grpc": bool|null, "jobs": int|null}
+
+    After each job a single line CUT_WORKER_RESULT_PREFIX + {"returncode": int} is
+    written to stdout; all other stdout lines are regular log output.
+    """
+    # Load pyedb now, while the GUI is still collecting the first job
+    try:
+        _import_pyedb()
+    except ImportError as e:
+        logger.warning(f"pyedb preload failed: {e}")
+
+    logger.info("[SERVER MODE] Waiting for cut jobs on stdin")
+    while True:
+        line = sys.stdin.buffer.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+
+        try:
+            request = _loads(line)
+            jobs = request.get('jobs')
+            returncode = run_cut_job(
+                request['edb_path'],
+                request['edb_version'],
+                request['input_file'],
+                request.get('grpc'),
+                max(1, int(jobs)) if jobs else None,
+            )
+        except Exception as e:
+            log_exception("cut worker request", e)
+            returncode = 1
+
+        sys.stdout.write(f"{CUT_WORKER_RESULT_PREFIX}{json.dumps({'returncode': returncode})}\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for subprocess.
+
+    Expected command line arguments:
+        sys.argv[1]: edb_path (path to .aedb folder or edb.def file)
+        sys.argv[2]: edb_version (e.g., "2025.1")
+        sys.argv[3]: cut_file_path (path to cut JSON file or batch JSON file)
+        sys.argv[4]: grpc (optional, "True" or "False"; if omitted, gRPC is
+                     auto-enabled for multi-clone runs on AEDT 2025.2+)
+        sys.argv[5]: jobs (optional, max parallel clone workers,
+                     default: EDB_CUT_PARALLELISM or CPU count)
+
+    Alternatively, "--server" starts a persistent worker that reads jobs from stdin.
+    """
+    if CUT_WORKER_SERVER_FLAG in sys.argv[1:]:
+        _serve_loop()
+        sys.exit(0)
+
+    if len(sys.argv) < 4:
+        logger.info("[ERROR] Insufficient arguments")
+        logger.info("Usage: python -m edb.cut <edb_path> <edb_version> <cut_file_path> [grpc] [jobs]")
+        sys.exit(1)
+
+    max_jobs = None
+    if len(sys.argv) > 5:
+        try:
+            max_jobs = max(1, int(sys.argv[5]))
+        except ValueError:
+            logger.info(f"[ERROR] Invalid jobs value: {sys.argv[5]!r} (expected an integer)")
+            logger.info("Usage: python -m edb.cut <edb_path> <edb_version> <cut_file_path> [grpc] [jobs]")
+            sys.exit(1)
+
+    sys.exit(run_cut_job(
+        edb_path=sys.argv[1],
+        edb_version=sys.argv[2],
+        input_file_path=sys.argv[3],
+        grpc=sys.argv[4].lower() == 'true' if len(sys.argv) > 4 else None,
+        max_jobs=max_jobs,
+    ))
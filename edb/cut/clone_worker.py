@@ -0,0 +1,138 @@
+"""
+Clone Worker Module
+
+This module runs the assigned cuts on one EDB clone for python -m edb.cut.
+It lives outside __main__ so ProcessPoolExecutor workers started with spawn
+(the only start method on Windows) can import the job function: spawn does
+not re-import a package's __main__ module in the child.
+"""
+import logging
+import os
+from os.path import basename, splitext
+from types import MappingProxyType
+
+from util.logger_module import logger, buffered_console_output, set_console_level
+
+from .edb_manager import execute_cuts_on_clone
+
+# Set EDB_CUT_DEBUG=1 for verbose logging (full selected_nets per cut, per-clone cut mapping).
+# Otherwise the cut worker and its pool processes drop DEBUG records at the
+# logger, so logger.isEnabledFor(logging.DEBUG) guards skip their work
+_CUT_DEBUG = bool(os.environ.get('EDB_CUT_DEBUG'))
+if _CUT_DEBUG:
+    set_console_level(logging.DEBUG)
+else:
+    logger.setLevel(logging.INFO)
+
+# Banner rule for clone sections of the log
+_DASH = "-" * 70
+
+
+def _log_lines(*lines):
+    """
+    Log several lines as a single INFO record.
+
+    One record per phase takes the handler lock and flushes once instead of
+    once per line.
+
+    Args:
+        *lines: Lines to log, joined with newlines
+    """
+    logger.info("\n".join(lines))
+
+
+def _cut_stem(cut_file_path):
+    """Return the file name without extension (string-only equivalent of Path(...).stem)"""
+    return splitext(basename(cut_file_path))[0]
+
+
+def _process_clone(args):
+    """
+    Execute the assigned cuts on one EDB clone.
+
+    Top-level function so it can be dispatched to a ProcessPoolExecutor worker.
+    Console output is buffered and written once per clone so parallel clones
+    do not interleave their lines. Sequential runs call _run_clone directly
+    to keep live progress on the console.
+
+    Args:
+        args: Tuple of (index, num_clones, clone_path, clone_edb_path, assigned_cut_files,
+              assigned_cut_ids, cut_data_cache, previous_cut_file, selected_nets, stackup_xml_paths,
+              edb_version, grpc). assigned_cut_ids are the file stems of the assigned
+              cuts; cut_data_cache maps cut file paths to parsed cut data for the
+              assigned cuts and the previous cut in the global sequence.
+
+    Returns:
+        tuple: (index, success, failed_cut_labels)
+    """
+    with buffered_console_output():
+        return _run_clone(*args)
+
+
+def _run_clone(i, num_clones, clone_path, clone_edb_path, assigned_cut_files,
+               assigned_cut_ids, cut_data_cache, previous_cut_file, selected_nets, stackup_xml_paths,
+               edb_version, grpc):
+    """Body of _process_clone (see there for arguments and return value)"""
+    _log_lines(
+        _DASH,
+        f"Processing Clone {i}/{num_clones}: {basename(clone_path)}",
+        f"Assigned cuts: {', '.join(assigned_cut_ids)}",
+        _DASH,
+    )
+
+    success = False
+    failed_cuts = []
+    try:
+        # Load all cut data for this clone
+        # Merge selected nets into shallow copies; the cached dicts stay untouched
+        # as long as cut steps only set top-level keys (see execute_cuts_on_clone).
+        # All cuts share one read-only view of selected_nets, so a cut step cannot
+        # change the nets seen by the next cut. (Frozen here rather than in the
+        # parent because MappingProxyType cannot be pickled to pool workers.)
+        selected_nets = MappingProxyType(selected_nets)
+        cut_data_list = [
+            {**cut_data_cache[cut_file_path], 'selected_nets': selected_nets}
+            for cut_file_path in assigned_cut_files
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            nets_detail = (selected_nets if _CUT_DEBUG else
+                           f"(signal={len(selected_nets['signal'])}, power={len(selected_nets['power'])})")
+            for cut_data in cut_data_list:
+                logger.debug("Added selected_nets to cut %s: %s", cut_data.get('id', 'unknown'), nets_detail)
+
+        # Select appropriate stackup XML for this clone
+        # Use first cut's stackup (temporary solution until execute_cuts_on_clone supports per-cut stackup)
+        clone_stackup_path = None
+        if stackup_xml_paths and len(assigned_cut_files) > 0:
+            first_cut_id = assigned_cut_ids[0]
+            clone_stackup_path = stackup_xml_paths.get(first_cut_id)
+
+            if len(assigned_cut_files) > 1:
+                logger.warning(f"Clone has {len(assigned_cut_files)} cuts, using {first_cut_id} stackup XML")
+                logger.warning("Future enhancement: Pass separate stackup XML for each cut")
+
+        # Previous cut in global sequence is used for proximity-based port sorting
+        previous_cut_points = None
+        if previous_cut_file is not None:
+            previous_cut_points = cut_data_cache[previous_cut_file].get('points', [])
+            logger.info(f"Found previous cut in sequence: {_cut_stem(previous_cut_file)}")
+            logger.info(f"Previous cut has {len(previous_cut_points)} polygon points")
+
+        # Execute all cuts on this clone (opens EDB once, processes all cuts, closes EDB)
+        success = execute_cuts_on_clone(clone_edb_path, edb_version, cut_data_list, grpc, clone_stackup_path, previous_cut_points)
+
+        if success:
+            logger.info(f"All cuts completed successfully on clone {i}")
+        else:
+            logger.error(f"Some cuts failed on clone {i}")
+            for cut_data in cut_data_list:
+                failed_cuts.append(f"{cut_data.get('id', 'unknown')} (clone {i})")
+
+    except Exception as clone_error:
+        logger.error(f"Failed to process clone {i}: {clone_error}")
+        success = False
+        for cut_id in assigned_cut_ids:
+            failed_cuts.append(f"{cut_id} (clone {i})")
+
+    logger.info("")
+    return i, success, failed_cuts
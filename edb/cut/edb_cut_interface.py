@@ -3,55 +3,55 @@ EDB Cascade Interface Module
 
 This module provides a unified interface for EDB cutting operations.
 It re-exports functions from edb_manager and net_port_handler for backward compatibility.
-"""
 
-# Import from edb_manager
-from .edb_manager import (
-    open_edb,
-    clone_edbs_for_cuts,
-    point_to_line_segment_distance,
-    find_cutout_edge_intersections,
-    is_point_in_polygon,
-    calculate_point_distance,
-    execute_cuts_on_clone
-)
-
-# Import from net_port_handler
-from .net_port_handler import (
-    apply_cutout,
-    find_endpoint_pads,
-    find_nearest_pad_to_point,
-    find_net_extreme_endpoints,
-    find_endpoint_pads_for_selected_nets,
-    is_valid_padstack,
-    remove_and_create_ports,
-    create_gap_ports
-)
+Exports are resolved lazily (PEP 562): a submodule is imported on first
+access to one of its names, so callers that only need edb_manager functions
+do not load net_port_handler.
+"""
+from importlib import import_module
 
-# Re-export all functions for backward compatibility
-__all__ = [
+# {exported name: defining submodule}
+_EXPORTS = {
     # EDB Management
-    'open_edb',
-    'clone_edbs_for_cuts',
-    'execute_cuts_on_clone',
+    'open_edb': 'edb_manager',
+    'clone_edbs_for_cuts': 'edb_manager',
+    'execute_cuts_on_clone': 'edb_manager',
 
     # Geometric Utilities
-    'point_to_line_segment_distance',
-    'find_cutout_edge_intersections',
-    'is_point_in_polygon',
-    'calculate_point_distance',
+    'point_to_line_segment_distance': 'edb_manager',
+    'find_cutout_edge_intersections': 'edb_manager',
+    'is_point_in_polygon': 'edb_manager',
+    'calculate_point_distance': 'edb_manager',
 
     # Network Analysis
-    'find_endpoint_pads',
-    'find_nearest_pad_to_point',
-    'find_net_extreme_endpoints',
-    'find_endpoint_pads_for_selected_nets',
+    'find_endpoint_pads': 'net_port_handler',
+    'find_nearest_pad_to_point': 'net_port_handler',
+    'find_net_extreme_endpoints': 'net_port_handler',
+    'find_endpoint_pads_for_selected_nets': 'net_port_handler',
 
     # Cutout Operations
-    'apply_cutout',
+    'apply_cutout': 'net_port_handler',
 
     # Port Operations
-    'is_valid_padstack',
-    'remove_and_create_ports',
-    'create_gap_ports',
-]
+    'is_valid_padstack': 'net_port_handler',
+    'remove_and_create_ports': 'net_port_handler',
+    'create_gap_ports': 'net_port_handler',
+}
+
+# Re-export all functions for backward compatibility
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access and cache the attribute"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazy exports alongside the module globals"""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -4,13 +4,33 @@ EDB Manager Module
 This module handles EDB file management and geometric utility functions.
 Provides functions for opening, cloning, and basic geometric calculations.
 """
-import pyedb
+import functools
+import gc
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from util.logger_module import logger, log_exception
+from util.json_utils import load_json_file
+from util.path_utils import copy_tree
 from edb.cut.stackup_loader import replace_stackup
 
 
+# Set EDB_CLONE_DIRECT=1 to copy the original .aedb folder for every clone instead of
+# opening it with pyedb and using save_as for the first clone. Only for source EDBs that
+# are already saved in the target version and not open in another tool (save_as also
+# converts the design to edb_version).
+_CLONE_DIRECT = os.environ.get('EDB_CLONE_DIRECT') == '1'
+
+
+@functools.cache
+def _import_pyedb():
+    """Import pyedb on first use so the subprocess can start without loading it."""
+    import pyedb
+    return pyedb
+
+
 def open_edb(edbpath, edbversion, grpc=False):
     """
     Open EDB file using pyedb.
@@ -36,7 +56,7 @@ def open_edb(edbpath, edbversion, grpc=False):
 
     try:
         logger.info("Opening EDB...")
-        edb = pyedb.Edb(edbpath=edbpath, version=edbversion, grpc=grpc)
+        edb = _import_pyedb().Edb(edbpath=edbpath, version=edbversion, grpc=grpc)
         logger.info("[OK] EDB opened successfully\n")
         return edb
 
@@ -93,34 +113,61 @@ def clone_edbs_for_cuts(original_edb_path, num_clones, edb_version, grpc):
         logger.info(f"Created output directory: {results_dir}")
         logger.info("")
 
-        # Open original EDB
-        logger.info(f"Opening original EDB: {original_aedb_folder}")
-        edb = pyedb.Edb(str(original_aedb_folder), version=edb_version, grpc=grpc)
-        logger.info("[OK] Original EDB opened successfully")
-        logger.info("")
-
         # Clone EDB files
-        cloned_paths = []
+        cloned_paths = [
+            str(results_dir / f"{original_name}_{i:03d}.aedb")
+            for i in range(1, num_clones + 1)
+        ]
         logger.info(f"Starting cloning process ({num_clones} clones)...")
         logger.info("")
 
-        for i in range(1, num_clones + 1):
-            clone_name = f"{original_name}_{i:03d}.aedb"
-            clone_path = results_dir / clone_name
-
-            logger.info(f"[{i}/{num_clones}] Cloning to: {clone_path}")
-
-            # Use save_as to create clone
-            edb.save_as(str(clone_path))
-            cloned_paths.append(str(clone_path))
-
-            logger.info(f"Clone {i} created successfully")
+        if _CLONE_DIRECT:
+            # Every clone is a directory copy of the original; pyedb is not loaded
+            copy_source = str(original_aedb_folder)
+            copy_targets = cloned_paths
+        else:
+            # Open original EDB
+            logger.info(f"Opening original EDB: {original_aedb_folder}")
+            edb = _import_pyedb().Edb(str(original_aedb_folder), version=edb_version, grpc=grpc)
+            logger.info("[OK] Original EDB opened successfully")
             logger.info("")
 
-        # Close original EDB
-        edb.close()
-        logger.info("[OK] Original EDB closed")
-        logger.info("")
+            # Use save_as to create the first clone
+            first_clone = cloned_paths[0]
+            try:
+                logger.info(f"[1/{num_clones}] Cloning to: {first_clone}")
+                edb.save_as(first_clone)
+                logger.info("Clone 1 created successfully")
+                logger.info("")
+            finally:
+                # Close original EDB even if save_as failed, and collect its
+                # .NET wrappers so a long-lived cut worker does not keep them
+                try:
+                    edb.close()
+                    logger.info("[OK] Original EDB closed")
+                except Exception as close_error:
+                    logger.warning(f"Failed to close original EDB: {close_error}")
+                del edb
+                gc.collect()
+                logger.info("")
+
+            # Remaining clones are copies of the first one
+            copy_source = first_clone
+            copy_targets = cloned_paths[1:]
+
+        # Directory copies run concurrently since each copy is I/O bound
+        if copy_targets:
+            logger.info(f"Copying {len(copy_targets)} clone(s) from {copy_source}...")
+
+            def copy_clone(clone_path):
+                return clone_path, copy_tree(copy_source, clone_path)
+
+            first_index = num_clones - len(copy_targets) + 1
+            with ThreadPoolExecutor(max_workers=min(len(copy_targets), 8)) as executor:
+                for i, (clone_path, reflinked) in enumerate(executor.map(copy_clone, copy_targets), first_index):
+                    copy_mode = "copy-on-write" if reflinked else "byte copy"
+                    logger.info(f"[{i}/{num_clones}] Clone created ({copy_mode}): {clone_path}")
+            logger.info("")
 
         logger.info("=" * 70)
         logger.info(f"[SUCCESS] Created {num_clones} EDB clones")
@@ -157,7 +204,7 @@ def point_to_line_segment_distance(point, line_start, line_end):
 
     if length_sq == 0:
         # Line segment is actually a point
-        return ((px - x1) ** 2 + (py - y1) ** 2) ** 0.5
+        return math.hypot(px - x1, py - y1)
 
     # Calculate parameter t (0 <= t <= 1) for closest point on line segment
     # t represents position along line: 0 = start, 1 = end
@@ -168,7 +215,7 @@ def point_to_line_segment_distance(point, line_start, line_end):
     closest_y = y1 + t * dy
 
     # Calculate distance from point to closest point
-    return ((px - closest_x) ** 2 + (py - closest_y) ** 2) ** 0.5
+    return math.hypot(px - closest_x, py - closest_y)
 
 
 def find_cutout_edge_intersections(coords, polygon_points, tolerance=1e-6):
@@ -198,46 +245,57 @@ def find_cutout_edge_intersections(coords, polygon_points, tolerance=1e-6):
             else:
                 logger.warning(f"Skipping invalid coordinate: [{x}, {y}]")
 
-    logger.debug(f"Total coords: {len(coords)}, Valid coords: {len(valid_coords)}")
+    logger.debug("Total coords: %d, Valid coords: %d", len(coords), len(valid_coords))
 
-    # 1. Generate all edges from polygon_points (closed polygon)
-    edges = []
     n = len(polygon_points)
-
-    for i in range(n):
-        start = polygon_points[i]
-        end = polygon_points[(i + 1) % n]  # Connect last point to first
-        edges.append([start, end])
-
-    # 2. For each edge, find coords points that are close to it
+    if not valid_coords or n == 0:
+        return []
+
+    import numpy as np
+
+    # 1. Edges of the closed polygon as (start, end) arrays; edge i runs from
+    #    polygon_points[i] to polygon_points[(i + 1) % n]
+    starts = np.array([(pt[0], pt[1]) for pt in polygon_points], dtype=np.float64)
+    ends = np.roll(starts, -1, axis=0)
+    points = np.array([(coord[0], coord[1]) for coord in valid_coords], dtype=np.float64)
+
+    # 2. Distance from every coord to every edge in one pass, shape (edges, coords)
+    #    (same projection as point_to_line_segment_distance)
+    direction = ends - starts
+    length_sq = np.einsum('ij,ij->i', direction, direction)
+    offset = points[np.newaxis, :, :] - starts[:, np.newaxis, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.einsum('ekj,ej->ek', offset, direction) / length_sq[:, np.newaxis]
+    # Clamp to the segment; a zero-length edge measures to its start point
+    t = np.where(length_sq[:, np.newaxis] == 0, 0.0, np.clip(t, 0.0, 1.0))
+    residual = offset - t[:, :, np.newaxis] * direction[:, np.newaxis, :]
+    touching = np.sqrt(np.einsum('ekj,ekj->ek', residual, residual)) < tolerance
+
+    # 3. For each touched edge, take the midpoint of its first and last touching
+    #    coord (in coords order)
     results = []
+    last_index = len(valid_coords) - 1
 
-    for edge in edges:
-        touching_points = []
-
-        for coord in valid_coords:  # Use filtered valid_coords instead of coords
-            # Calculate distance from coord to edge
-            dist = point_to_line_segment_distance(coord, edge[0], edge[1])
-
-            if dist < tolerance:
-                touching_points.append(coord)
-
-        # 3. If there are touching points, calculate midpoint
-        if len(touching_points) > 0:
-            if len(touching_points) == 1:
-                # Only one point touching this edge
-                midpoint = touching_points[0]
-            else:
-                # Calculate midpoint between first and last touching point
-                first = touching_points[0]
-                last = touching_points[-1]
-                midpoint = [
-                    (first[0] + last[0]) / 2,
-                    (first[1] + last[1]) / 2
-                ]
+    for i in np.flatnonzero(touching.any(axis=1)).tolist():
+        row = touching[i]
+        first_index = int(row.argmax())
+        last_index_on_edge = last_index - int(row[::-1].argmax())
 
-            # Store as tuple (edge, midpoint)
-            results.append((edge, midpoint))
+        if first_index == last_index_on_edge:
+            # Only one point touching this edge
+            midpoint = valid_coords[first_index]
+        else:
+            # Calculate midpoint between first and last touching point
+            first = valid_coords[first_index]
+            last = valid_coords[last_index_on_edge]
+            midpoint = [
+                (first[0] + last[0]) / 2,
+                (first[1] + last[1]) / 2
+            ]
+
+        # Store as tuple (edge, midpoint)
+        edge = [polygon_points[i], polygon_points[(i + 1) % n]]
+        results.append((edge, midpoint))
 
     return results
 
@@ -292,9 +350,7 @@ def calculate_point_distance(pt1, pt2):
     Returns:
         float: Euclidean distance
     """
-    dx = pt2[0] - pt1[0]
-    dy = pt2[1] - pt1[1]
-    return (dx * dx + dy * dy) ** 0.5
+    return math.hypot(pt2[0] - pt1[0], pt2[1] - pt1[1])
 
 
 def execute_cuts_on_clone(edbpath, edbversion, cut_data_list, grpc=False, stackup_xml_path=None, previous_cut_points=None):
@@ -305,7 +361,10 @@ def execute_cuts_on_clone(edbpath, edbversion, cut_data_list, grpc=False, stacku
     Args:
         edbpath: Path to EDB file (edb.def path)
         edbversion: AEDT version string (e.g., "2025.1")
-        cut_data_list: List of cut data dictionaries
+        cut_data_list: List of cut data dictionaries. These are shallow copies
+            of cached cut files: cut steps may set top-level keys (e.g.
+            'endpoint_pads', 'gap_port_info') but must not mutate nested
+            values such as 'points' or the shared read-only 'selected_nets'
         grpc: Use gRPC mode (default: False)
         stackup_xml_path: Optional path to stackup XML file to load
         previous_cut_points: Polygon points from previous cut in the global sequence (for proximity-based port sorting)
@@ -325,14 +384,17 @@ def execute_cuts_on_clone(edbpath, edbversion, cut_data_list, grpc=False, stacku
         logger.info("[WARNING] No cuts provided to execute_cuts_on_clone")
         return True
 
-    logger.info("=" * 70)
-    logger.info(f"EDB Cascade - Execute {len(cut_data_list)} Cut(s) on Clone")
-    logger.info("=" * 70)
-    logger.info(f"EDB Path: {edbpath}")
-    logger.info(f"Number of Cuts: {len(cut_data_list)}")
-    for i, cut_data in enumerate(cut_data_list, 1):
-        logger.info(f"  Cut {i}: {cut_data.get('id', 'unknown')} ({cut_data.get('type', 'unknown')})")
-    logger.info("")
+    # Header and cut list as one log record
+    logger.info("\n".join([
+        "=" * 70,
+        f"EDB Cascade - Execute {len(cut_data_list)} Cut(s) on Clone",
+        "=" * 70,
+        f"EDB Path: {edbpath}",
+        f"Number of Cuts: {len(cut_data_list)}",
+        *(f"  Cut {i}: {cut_data.get('id', 'unknown')} ({cut_data.get('type', 'unknown')})"
+          for i, cut_data in enumerate(cut_data_list, 1)),
+        "",
+    ]))
 
     # Open EDB once
     try:
@@ -343,92 +405,107 @@ def execute_cuts_on_clone(edbpath, edbversion, cut_data_list, grpc=False, stacku
 
     all_success = True
 
-    # Load stackup if XML path provided (before processing cuts)
-    if stackup_xml_path:
-        try:
-            xml_path_str = str(stackup_xml_path) if isinstance(stackup_xml_path, Path) else stackup_xml_path
-
-            logger.info("=" * 70)
-            logger.info("Replacing Stackup from XML")
-            logger.info("=" * 70)
-            logger.info(f"XML Path: {xml_path_str}")
-
-            success = replace_stackup(edb, xml_path_str)
-
-            if success:
-                logger.info("[OK] Stackup replaced successfully")
-            else:
-                logger.warning("[WARNING] Stackup replacement returned False")
-
+    completed = False
+    try:
+        # Load stackup if XML path provided (before processing cuts)
+        if stackup_xml_path:
+            try:
+                xml_path_str = str(stackup_xml_path) if isinstance(stackup_xml_path, Path) else stackup_xml_path
+
+                logger.info("=" * 70)
+                logger.info("Replacing Stackup from XML")
+                logger.info("=" * 70)
+                logger.info(f"XML Path: {xml_path_str}")
+
+                success = replace_stackup(edb, xml_path_str)
+
+                if success:
+                    logger.info("[OK] Stackup replaced successfully")
+                else:
+                    logger.warning("[WARNING] Stackup replacement returned False")
+
+                logger.info("")
+
+            except Exception as stackup_error:
+                log_exception("stackup replacement", stackup_error, level="warning")
+                logger.info("")
+
+        # Process each cut
+        # Initialize with previous cut from global sequence (passed as parameter)
+        # Will be updated within loop for multi-cut clones (polyline mode)
+        prev_points = previous_cut_points
+        for i, cut_data in enumerate(cut_data_list, 1):
+            logger.info("\n".join([
+                "-" * 50,
+                f"Processing Cut {i}/{len(cut_data_list)}: {cut_data.get('id', 'unknown')}",
+                "-" * 50,
+                f"Cut Type: {cut_data.get('type', 'unknown')}",
+                f"Number of Points: {len(cut_data.get('points', []))}",
+                "",
+            ]))
+
+            # Execute cut workflow in sequence
+            # 1. Find endpoint pads for selected signal nets
+            logger.info("[1/5] Finding endpoint pads for selected nets...")
+            find_endpoint_pads_for_selected_nets(edb, cut_data)
             logger.info("")
 
-        except Exception as stackup_error:
-            log_exception("stackup replacement", stackup_error, level="warning")
+            # 2. Apply cutout (remove traces outside polygon)
+            logger.info("[2/5] Applying cutout...")
+            apply_cutout(edb, cut_data)
             logger.info("")
 
-    # Process each cut
-    # Initialize with previous cut from global sequence (passed as parameter)
-    # Will be updated within loop for multi-cut clones (polyline mode)
-    prev_points = previous_cut_points
-    for i, cut_data in enumerate(cut_data_list, 1):
-        logger.info("-" * 50)
-        logger.info(f"Processing Cut {i}/{len(cut_data_list)}: {cut_data.get('id', 'unknown')}")
-        logger.info("-" * 50)
-        logger.info(f"Cut Type: {cut_data.get('type', 'unknown')}")
-        logger.info(f"Number of Points: {len(cut_data.get('points', []))}")
-        logger.info("")
-
-        # Execute cut workflow in sequence
-        # 1. Find endpoint pads for selected signal nets
-        logger.info("[1/5] Finding endpoint pads for selected nets...")
-        find_endpoint_pads_for_selected_nets(edb, cut_data)
-        logger.info("")
-
-        # 2. Apply cutout (remove traces outside polygon)
-        logger.info("[2/5] Applying cutout...")
-        apply_cutout(edb, cut_data)
-        logger.info("")
+            # 3. Create circuit ports (only for endpoints inside polygon)
+            logger.info("[3/5] Creating circuit ports...")
+            remove_and_create_ports(edb, cut_data)
+            logger.info("")
 
-        # 3. Create circuit ports (only for endpoints inside polygon)
-        logger.info("[3/5] Creating circuit ports...")
-        remove_and_create_ports(edb, cut_data)
-        logger.info("")
+            # 4. Create gap ports (only for endpoints inside polygon)
+            logger.info("[4/5] Creating gap ports...")
+            create_gap_ports(edb, cut_data, prev_points)
+            logger.info("")
 
-        # 4. Create gap ports (only for endpoints inside polygon)
-        logger.info("[4/5] Creating gap ports...")
-        create_gap_ports(edb, cut_data, prev_points)
-        logger.info("")
+            # 5. Additional cut operations (future implementation)
+            logger.info("[5/5] Additional cut operations...")
+            logger.info("Cut data received:")
+            logger.info(f"  Type: {cut_data.get('type')}")
+            # Full point list only at DEBUG; %-style args are not formatted otherwise
+            logger.info(f"  Points: {len(cut_data.get('points', []))}")
+            logger.debug("  Point list: %s", cut_data.get('points'))
+            logger.info(f"  ID: {cut_data.get('id')}")
+            logger.info(f"  Timestamp: {cut_data.get('timestamp')}")
+            logger.info("")
+            logger.info("[INFO] All cutting operations completed successfully.")
+            logger.info("")
 
-        # 5. Additional cut operations (future implementation)
-        logger.info("[5/5] Additional cut operations...")
-        logger.info("Cut data received:")
-        logger.info(f"  Type: {cut_data.get('type')}")
-        logger.info(f"  Points: {cut_data.get('points')}")
-        logger.info(f"  ID: {cut_data.get('id')}")
-        logger.info(f"  Timestamp: {cut_data.get('timestamp')}")
-        logger.info("")
-        logger.info("[INFO] All cutting operations completed successfully.")
-        logger.info("")
+            # Update prev_points for next iteration (for multi-cut clones)
+            prev_points = cut_data.get('points', [])
 
-        # Update prev_points for next iteration (for multi-cut clones)
-        prev_points = cut_data.get('points', [])
+        completed = True
 
-    # Close EDB once (after all cuts processed)
-    try:
-        edb.save()
-        edb.close()
-        logger.info("[OK] EDB closed successfully after processing all cuts")
-    except Exception as e:
-        logger.warning(f"Failed to close EDB: {e}")
-        all_success = False
+    finally:
+        # Close EDB once (after all cuts processed). If a cut step raised, the
+        # EDB is closed without saving before the error propagates, so a
+        # long-lived cut worker does not keep the clone open.
+        try:
+            if completed:
+                edb.save()
+            edb.close()
+            logger.info("[OK] EDB closed successfully after processing all cuts")
+        except Exception as e:
+            logger.warning(f"Failed to close EDB: {e}")
+            all_success = False
 
     return all_success
 
 
+@functools.lru_cache(maxsize=64)
 def get_edb_folder_name(edb_path):
     """
     Extract EDB folder name from either edb.def file path or .aedb folder path.
 
+    Memoized: the cut worker derives the name for every job on the same EDB.
+
     Args:
         edb_path: Path to EDB file (edb.def) or folder (.aedb)
 
@@ -446,6 +523,56 @@ def get_edb_folder_name(edb_path):
         return edb_path_obj.name
 
 
+# SSS file names are matched like Path.glob('*_sections_*.sss') and
+# '*_layers_*.sss' (case-insensitive on Windows), using plain string checks
+_SSS_CASE_FOLD = os.name == 'nt'
+
+
+def _scan_sss_files(sss_dir):
+    """
+    Find the latest sections and layers SSS files of a directory in one scan.
+
+    The newest file of each kind is tracked while scanning, reusing the
+    stat result cached on each os.DirEntry, so no candidate list is built.
+
+    Args:
+        sss_dir: Directory to scan
+
+    Returns:
+        tuple: (sections, layers), each a (path, mtime_ns) tuple of the most
+               recently modified matching file, or None if there is none
+
+    Raises:
+        FileNotFoundError: If sss_dir does not exist
+    """
+    latest = [None, None]
+    with os.scandir(sss_dir) as entries:
+        for entry in entries:
+            name = entry.name.lower() if _SSS_CASE_FOLD else entry.name
+            if not name.endswith('.sss'):
+                continue
+            stem = name[:-4]
+            if '_sections_' in stem:
+                kind = 0
+            elif '_layers_' in stem:
+                kind = 1
+            else:
+                continue
+            if not entry.is_file():
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+            # Strictly newer only: the first of equally old files wins, as with max()
+            if latest[kind] is None or mtime_ns > latest[kind][1]:
+                latest[kind] = (entry.path, mtime_ns)
+    return latest[0], latest[1]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_sss_cached(path_str, mtime_ns):
+    """Parse an SSS file; mtime_ns is part of the cache key so rewritten files are reloaded"""
+    return load_json_file(path_str)
+
+
 def load_sss_files(sss_dir):
     """
     Find and load the latest SSS (sections and layers) files from a directory.
@@ -456,13 +583,11 @@ def load_sss_files(sss_dir):
     Returns:
         dict: Dictionary with keys:
             - 'success': bool - True if files loaded successfully
-            - 'sections_data': dict - Loaded sections JSON data (None if not found)
-            - 'layers_data': dict - Loaded layers JSON data (None if not found)
+            - 'sections_data': dict - Loaded sections JSON data (None if not found; shared, read-only)
+            - 'layers_data': dict - Loaded layers JSON data (None if not found; shared, read-only)
             - 'sections_path': Path - Path to sections file (None if not found)
             - 'layers_path': Path - Path to layers file (None if not found)
     """
-    import json
-
     result = {
         'success': False,
         'sections_data': None,
@@ -471,31 +596,28 @@ def load_sss_files(sss_dir):
         'layers_path': None
     }
 
-    if not sss_dir.exists():
+    # Find most recent *_sections_*.sss and *_layers_*.sss files
+    # (a missing directory surfaces from scandir, saving a separate exists() stat)
+    try:
+        latest_sections, latest_layers = _scan_sss_files(sss_dir)
+    except FileNotFoundError:
         logger.info(f"SSS directory not found: {sss_dir}")
         return result
 
-    # Find most recent *_sections_*.sss and *_layers_*.sss files
-    sections_files = list(sss_dir.glob('*_sections_*.sss'))
-    layers_files = list(sss_dir.glob('*_layers_*.sss'))
-
-    if not sections_files or not layers_files:
+    if latest_sections is None or latest_layers is None:
         logger.info("Missing sss files (sections or layers), skipping stackup generation")
         return result
 
-    # Sort by modification time and get the latest
-    latest_sections_sss = max(sections_files, key=lambda p: p.stat().st_mtime)
-    latest_layers_sss = max(layers_files, key=lambda p: p.stat().st_mtime)
+    latest_sections_sss = Path(latest_sections[0])
+    latest_layers_sss = Path(latest_layers[0])
 
     logger.info(f"Found section selection file: {latest_sections_sss}")
     logger.info(f"Found layer data file: {latest_layers_sss}")
 
     try:
-        # Load sss data
-        with open(latest_sections_sss, 'r', encoding='utf-8') as f:
-            sections_data = json.load(f)
-        with open(latest_layers_sss, 'r', encoding='utf-8') as f:
-            layers_data = json.load(f)
+        # Load sss data (cached per file and mtime, so repeated jobs skip the parse)
+        sections_data = _load_sss_cached(*latest_sections)
+        layers_data = _load_sss_cached(*latest_layers)
 
         result['success'] = True
         result['sections_data'] = sections_data
@@ -5,6 +5,11 @@ This module handles network analysis, endpoint finding, and port creation operat
 Provides functions for cutout operations, endpoint detection, and port generation.
 """
 
+import heapq
+import logging
+import math
+from typing import NamedTuple
+
 from util.logger_module import logger
 
 from .edb_manager import (
@@ -14,6 +19,13 @@ from .edb_manager import (
 )
 
 
+class GapPortInfo(NamedTuple):
+    """Gap port candidate recorded by apply_cutout for create_gap_ports"""
+    net_name: str
+    prim_id: int
+    edge_intersections: list  # [(edge, midpoint), ...]
+
+
 def apply_cutout(edb, cut_data):
     """
     Apply cutout operation using polygon boundary to remove traces outside the region.
@@ -38,8 +50,11 @@ def apply_cutout(edb, cut_data):
             return True
 
         logger.info(f"Polygon points: {len(polygon_points)}")
-        for idx, pt in enumerate(polygon_points):
-            logger.info(f"  Point {idx}: [{pt[0]:.6f}, {pt[1]:.6f}] meters")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n".join(
+                f"  Point {idx}: [{pt[0]:.6f}, {pt[1]:.6f}] meters"
+                for idx, pt in enumerate(polygon_points)
+            ))
         logger.info("")
 
         # Get selected nets
@@ -89,26 +104,33 @@ def apply_cutout(edb, cut_data):
             # Initialize gap_port_info for storing edge intersection data
             cut_data["gap_port_info"] = []
 
+            # Each primitive property read goes through the EDB API, so the net
+            # name, polygon and clipped points are fetched once and reused for
+            # both the intersection test and the clip
+            signal_net_set = set(signal_nets)
             for prim in edb.modeler.primitives:
-                if prim.net_name in signal_nets:
-                    int_type = extent_poly.intersection_type(prim.polygon_data).value
+                net_name = prim.net_name
+                if net_name in signal_net_set:
+                    prim_polygon = prim.polygon_data
+                    int_type = extent_poly.intersection_type(prim_polygon).value
 
-                    if int_type in [3]:
+                    if int_type == 3:
                         clipped_polys = extent_poly.intersect(
-                            [extent_poly], [prim.polygon_data]
+                            [extent_poly], [prim_polygon]
                         )
 
                         for clipped_poly in clipped_polys:
-                            if clipped_poly.points:
+                            clipped_points = clipped_poly.points
+                            if clipped_points:
                                 coords = [
                                     [pt.x.value, pt.y.value]
-                                    for pt in clipped_poly.points
+                                    for pt in clipped_points
                                 ]
                                 logger.info(
-                                    f"Clipped coordinates ({len(coords)} points):"
+                                    f"Clipped coordinates ({len(coords)} points)"
                                 )
-                                for pt in coords:
-                                    logger.info(f"  {pt}")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("\n".join(f"  {pt}" for pt in coords))
 
                                 # Find cutout edge intersections
                                 logger.info("\n=== Cutout Edge Analysis ===")
@@ -116,50 +138,42 @@ def apply_cutout(edb, cut_data):
                                     coords, polygon_points, tolerance=1e-6
                                 )
 
-                                logger.info(
+                                # One log record for all edges instead of four per edge
+                                edge_lines = [
                                     f"Found edge intersections: {len(edge_intersections)}"
-                                )
+                                ]
                                 for idx, (edge, midpoint) in enumerate(
                                     edge_intersections, 1
                                 ):
-                                    logger.info(f"\n[{idx}] Edge:")
-                                    logger.info(
-                                        f"  Start: [{edge[0][0]:.9f}, {edge[0][1]:.9f}] meters"
+                                    edge_lines += (
+                                        f"\n[{idx}] Edge:",
+                                        f"  Start: [{edge[0][0]:.9f}, {edge[0][1]:.9f}] meters",
+                                        f"  End:   [{edge[1][0]:.9f}, {edge[1][1]:.9f}] meters",
+                                        f"  Center: [{midpoint[0]:.9f}, {midpoint[1]:.9f}] meters",
                                     )
-                                    logger.info(
-                                        f"  End:   [{edge[1][0]:.9f}, {edge[1][1]:.9f}] meters"
-                                    )
-                                    logger.info(
-                                        f"  Center: [{midpoint[0]:.9f}, {midpoint[1]:.9f}] meters"
-                                    )
-                                logger.info("=" * 50)
+                                edge_lines.append("=" * 50)
+                                logger.info("\n".join(edge_lines))
 
                                 # Store edge intersections info for gap port creation
                                 if edge_intersections:
-                                    gap_info = {
-                                        "net_name": prim.net_name,
-                                        "prim_id": prim.id,
-                                        "edge_intersections": edge_intersections,
-                                    }
+                                    gap_info = GapPortInfo(
+                                        net_name, prim.id, edge_intersections
+                                    )
                                     cut_data["gap_port_info"].append(gap_info)
                                     logger.debug(
-                                        f"Stored gap port info for {prim.net_name}, primitive ID: {prim.id}"
+                                        "Stored gap port info for %s, primitive ID: %s",
+                                        net_name,
+                                        gap_info.prim_id,
                                     )
 
             return True
 
         except Exception as cutout_error:
-            logger.error(f"Cutout operation failed: {cutout_error}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception(f"Cutout operation failed: {cutout_error}")
             return False
 
     except Exception as e:
-        logger.error(f"Failed to apply cutout: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to apply cutout: {e}")
         return False
 
 
@@ -295,6 +309,77 @@ def _find_nearest_pad_from_cache(cached_pads, point):
     return nearest_pad, min_distance
 
 
+def _merge_close_points(points, tolerance):
+    """
+    Merge points that lie within tolerance of each other into their average.
+
+    Points are visited in order; each unmerged point absorbs every later
+    unmerged point closer than tolerance to it. Candidates come from a grid
+    of tolerance-sized cells (only the 3x3 neighbouring cells can hold points
+    that close), so each point is compared with its neighbours instead of
+    with every later point. Points whose cell cannot be computed (NaN or
+    infinite coordinates, or coordinates too large for tolerance-sized
+    cells) share one overflow bucket and are only compared with each other.
+
+    Args:
+        points: List of [x, y] coordinates
+        tolerance: Distance threshold for merging close points
+
+    Returns:
+        list: Merged [x, y] points, in order of their first member
+    """
+    if tolerance <= 0:
+        return [[pt[0], pt[1]] for pt in points]
+
+    # Spatial hash: cell -> indices of the points in it (ascending);
+    # the None cell holds the points that have no grid cell
+    cells = {}
+    keys = []
+    for idx, pt in enumerate(points):
+        gx = pt[0] / tolerance
+        gy = pt[1] / tolerance
+        if math.isfinite(gx) and math.isfinite(gy):
+            key = (math.floor(gx), math.floor(gy))
+        else:
+            key = None
+        keys.append(key)
+        cells.setdefault(key, []).append(idx)
+
+    merged = []
+    used = [False] * len(points)
+
+    for i, pt in enumerate(points):
+        if used[i]:
+            continue
+
+        # Find all points close to this one
+        cluster = [pt]
+        used[i] = True
+
+        if keys[i] is None:
+            candidates = [j for j in cells[None] if j > i and not used[j]]
+        else:
+            cx, cy = keys[i]
+            candidates = sorted(
+                j
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                for j in cells.get((cx + dx, cy + dy), ())
+                if j > i and not used[j]
+            )
+        for j in candidates:
+            if calculate_point_distance(pt, points[j]) < tolerance:
+                cluster.append(points[j])
+                used[j] = True
+
+        # Average the cluster to get merged point
+        avg_x = sum(p[0] for p in cluster) / len(cluster)
+        avg_y = sum(p[1] for p in cluster) / len(cluster)
+        merged.append([avg_x, avg_y])
+
+    return merged
+
+
 def _find_net_extreme_endpoints_from_cache(cached_paths, tolerance=1e-3):
     """
     Find the two farthest endpoints of a net using pre-cached paths.
@@ -326,25 +411,7 @@ def _find_net_extreme_endpoints_from_cache(cached_paths, tolerance=1e-3):
         return None
 
     # 2. Merge close points (within tolerance)
-    merged = []
-    used = [False] * len(endpoints)
-
-    for i, pt in enumerate(endpoints):
-        if used[i]:
-            continue
-
-        cluster = [pt]
-        used[i] = True
-
-        for j in range(i + 1, len(endpoints)):
-            if not used[j]:
-                if calculate_point_distance(pt, endpoints[j]) < tolerance:
-                    cluster.append(endpoints[j])
-                    used[j] = True
-
-        avg_x = sum(p[0] for p in cluster) / len(cluster)
-        avg_y = sum(p[1] for p in cluster) / len(cluster)
-        merged.append([avg_x, avg_y])
+    merged = _merge_close_points(endpoints, tolerance)
 
     # 3. Find two farthest points
     max_dist = 0
@@ -409,27 +476,7 @@ def find_net_extreme_endpoints(edb, net_name, tolerance=1e-3):
         return None
 
     # 2. Merge close points (within tolerance)
-    merged = []
-    used = [False] * len(endpoints)
-
-    for i, pt in enumerate(endpoints):
-        if used[i]:
-            continue
-
-        # Find all points close to this one
-        cluster = [pt]
-        used[i] = True
-
-        for j in range(i + 1, len(endpoints)):
-            if not used[j]:
-                if calculate_point_distance(pt, endpoints[j]) < tolerance:
-                    cluster.append(endpoints[j])
-                    used[j] = True
-
-        # Average the cluster to get merged point
-        avg_x = sum(p[0] for p in cluster) / len(cluster)
-        avg_y = sum(p[1] for p in cluster) / len(cluster)
-        merged.append([avg_x, avg_y])
+    merged = _merge_close_points(endpoints, tolerance)
 
     # 3. Find two farthest points
     max_dist = 0
@@ -475,14 +522,14 @@ def find_endpoint_pads_for_selected_nets(edb, cut_data):
 
         # Get selected nets from cut_data
         selected_nets = cut_data.get("selected_nets", {})
-        logger.debug(f"cut_data keys: {list(cut_data.keys())}")
-        logger.debug(f"selected_nets from cut_data: {selected_nets}")
+        logger.debug("cut_data keys: %s", list(cut_data))
+        logger.debug("selected_nets from cut_data: %s", selected_nets)
         # logger.debug(f"Type of selected_nets: {type(selected_nets)}")
 
         signal_nets = selected_nets.get("signal", [])
-        logger.debug(f"signal_nets extracted: {signal_nets}")
+        logger.debug("signal_nets extracted: %s", signal_nets)
         # logger.debug(f"Type of signal_nets: {type(signal_nets)}")
-        logger.debug(f"Length of signal_nets: {len(signal_nets) if signal_nets else 0}")
+        logger.debug("Length of signal_nets: %d", len(signal_nets) if signal_nets else 0)
 
         # Get cut polyline points
         cut_points = cut_data.get("points", [])
@@ -651,10 +698,7 @@ def find_endpoint_pads_for_selected_nets(edb, cut_data):
         return True
 
     except Exception as e:
-        logger.error(f"Failed to find endpoint pads: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to find endpoint pads: {e}")
         cut_data["endpoint_pads"] = {}
         return False
 
@@ -778,6 +822,22 @@ def remove_and_create_ports(edb, cut_data):
         logger.info(f"Total power pins collected: {len(all_power_pins)}")
         logger.info("")
 
+        # Read each power pin's component and position once, instead of once per
+        # signal endpoint below (each property access crosses into the EDB API).
+        # Pins deleted by the cutout raise on access and are left out.
+        power_pins_by_component = {}  # {component name: [pins]}
+        power_pin_positions = []  # [(pin, position)] for pins with a valid position
+        for pin in all_power_pins:
+            try:
+                power_pin_positions.append((pin, pin.position))
+            except (AttributeError, RuntimeError, Exception):
+                pass
+            try:
+                if pin.component:
+                    power_pins_by_component.setdefault(pin.component.name, []).append(pin)
+            except (AttributeError, RuntimeError, Exception):
+                pass
+
         # Get polygon coordinates for region checking
         polygon_points = cut_data.get("points", [])
         if not polygon_points or len(polygon_points) < 3:
@@ -787,6 +847,12 @@ def remove_and_create_ports(edb, cut_data):
             use_polygon_filter = False
         else:
             use_polygon_filter = True
+            # Bounding box of the region: endpoints outside it are rejected with
+            # four comparisons instead of a full ray-casting pass
+            polygon_xs = [pt[0] for pt in polygon_points]
+            polygon_ys = [pt[1] for pt in polygon_points]
+            min_x, max_x = min(polygon_xs), max(polygon_xs)
+            min_y, max_y = min(polygon_ys), max(polygon_ys)
             logger.info(f"Polygon region defined with {len(polygon_points)} points")
             logger.info("Only endpoints inside polygon will have ports created")
             logger.info("")
@@ -816,7 +882,11 @@ def remove_and_create_ports(edb, cut_data):
 
                 # Check if endpoint is inside polygon region
                 if use_polygon_filter:
-                    is_inside = is_point_in_polygon(pin_position, polygon_points)
+                    is_inside = (
+                        min_x <= pin_position[0] <= max_x
+                        and min_y <= pin_position[1] <= max_y
+                        and is_point_in_polygon(pin_position, polygon_points)
+                    )
                     if not is_inside:
                         logger.info(
                             "      [SKIP] Endpoint outside polygon region - no port created"
@@ -831,18 +901,10 @@ def remove_and_create_ports(edb, cut_data):
 
                 # Strategy 1: Find power pins in the same component
                 if signal_pin.component:
-                    component_power_pins = []
-                    for pin in all_power_pins:
-                        try:
-                            # Check if power pin is still valid
-                            if pin.component and pin.component.name == component_name:
-                                component_power_pins.append(pin)
-                        except (AttributeError, RuntimeError, Exception):
-                            # Skip invalid power pins (deleted by cutout)
-                            continue
+                    component_power_pins = power_pins_by_component.get(component_name)
 
                     if component_power_pins:
-                        reference_pins = component_power_pins
+                        reference_pins = list(component_power_pins)
                         logger.info(
                             f"      Found {len(reference_pins)} power pins in same component"
                         )
@@ -853,40 +915,19 @@ def remove_and_create_ports(edb, cut_data):
                         "      No power pins in component, finding nearest pins..."
                     )
 
-                    # Calculate distance to each power pin (skip invalid pins)
-                    def calculate_distance(pin):
-                        try:
-                            pos = pin.position
-                            dx = pos[0] - pin_position[0]
-                            dy = pos[1] - pin_position[1]
-                            return (dx * dx + dy * dy) ** 0.5
-                        except (AttributeError, RuntimeError, Exception):
-                            # Return infinite distance for invalid pins
-                            return float("inf")
-
-                    # Filter out invalid power pins
-                    valid_power_pins = []
-                    for pin in all_power_pins:
-                        try:
-                            _ = pin.position  # Test if pin is valid
-                            valid_power_pins.append(pin)
-                        except (AttributeError, RuntimeError, Exception):
-                            continue
-
-                    if valid_power_pins:
-                        # Sort power pins by distance
-                        sorted_power_pins = sorted(
-                            valid_power_pins, key=calculate_distance
-                        )
-
+                    if power_pin_positions:
                         # Use closest 3 power pins as reference
-                        reference_pins = sorted_power_pins[:3]
+                        nearest = heapq.nsmallest(
+                            3,
+                            power_pin_positions,
+                            key=lambda item: calculate_point_distance(item[1], pin_position),
+                        )
+                        reference_pins = [pin for pin, _ in nearest]
 
-                        if reference_pins:
-                            nearest_distance = calculate_distance(reference_pins[0])
-                            logger.info(
-                                f"      Using {len(reference_pins)} nearest power pins (closest: {nearest_distance:.6f}m)"
-                            )
+                        nearest_distance = calculate_point_distance(nearest[0][1], pin_position)
+                        logger.info(
+                            f"      Using {len(reference_pins)} nearest power pins (closest: {nearest_distance:.6f}m)"
+                        )
                     else:
                         logger.info(
                             "      [WARNING] No valid power pins found (all deleted by cutout)"
@@ -933,10 +974,7 @@ def remove_and_create_ports(edb, cut_data):
         return True
 
     except Exception as e:
-        logger.error(f"Failed to create ports: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to create ports: {e}")
         return False
 
 
@@ -983,22 +1021,21 @@ def create_gap_ports(edb, cut_data, previous_cut_points=None):
         # 3. Create gap ports for each primitive's edge intersections
         total_ports_created = 0
         total_ports_failed = 0
+        # {prim_id: primitive}, built on first use
+        prims_by_id = None
 
         for gap_info in gap_port_info:
-            net_name = gap_info["net_name"]
-            prim_id = gap_info["prim_id"]
-            edge_intersections = gap_info["edge_intersections"]
+            net_name, prim_id, edge_intersections = gap_info
 
             logger.info(f"Processing net: {net_name}")
             logger.info(f"  Primitive ID: {prim_id}")
             logger.info(f"  Edge intersections: {len(edge_intersections)}")
 
-            # 4. Re-fetch primitive by ID (prim object cannot be serialized)
-            prim = None
-            for p in edb.modeler.primitives:
-                if p.id == prim_id:
-                    prim = p
-                    break
+            # 4. Re-fetch primitive by ID (prim object cannot be serialized).
+            # The modeler is enumerated once for all candidates, not per entry
+            if prims_by_id is None:
+                prims_by_id = {p.id: p for p in edb.modeler.primitives}
+            prim = prims_by_id.get(prim_id)
 
             if not prim:
                 logger.info(f"  [WARNING] Primitive {prim_id} not found. Skipping.")
@@ -1067,12 +1104,9 @@ def create_gap_ports(edb, cut_data, previous_cut_points=None):
                     total_ports_created += 1
 
                 except Exception as port_error:
-                    logger.info(
+                    logger.exception(
                         f"      [ERROR] Failed to create gap port: {port_error}"
                     )
-                    import traceback
-
-                    traceback.print_exc()
                     total_ports_failed += 1
 
             logger.info("")
@@ -1090,8 +1124,5 @@ def create_gap_ports(edb, cut_data, previous_cut_points=None):
         return True
 
     except Exception as e:
-        logger.error(f"Failed to create gap ports: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to create gap ports: {e}")
         return False
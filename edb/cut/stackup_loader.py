@@ -312,10 +312,7 @@ def replace_stackup(edb, xml_path: str) -> bool:
         return True
 
     except Exception as e:
-        logger.error(f"Error replacing stackup from {xml_path}: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Error replacing stackup from {xml_path}: {str(e)}")
         return False
 
 
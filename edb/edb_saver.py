@@ -7,6 +7,7 @@ import json
 import gzip
 from pathlib import Path
 from typing import Dict, List, Any
+from util.json_utils import loads
 from util.logger_module import logger
 
 
@@ -90,8 +91,9 @@ def load_edb_data(filename: str, source_dir: str = 'source') -> Any:
 
     logger.info(f"Loading: {filename}...")
 
-    with gzip.open(filepath, 'rt', encoding='utf-8') as f:
-        data = json.load(f)
+    # Decompress to bytes and parse in one call (orjson when available)
+    with gzip.open(filepath, 'rb') as f:
+        data = loads(f.read())
 
     item_count = len(data) if isinstance(data, list) else len(data.keys())
     logger.info(f"Loaded {item_count} items")
@@ -2,9 +2,10 @@
 GUI module for EDB Cascade using pywebview
 """
 import json
-import re
+import os
 import subprocess
 import sys
+import threading
 import time
 import tkinter as tk
 from datetime import datetime
@@ -16,26 +17,39 @@ import webview
 from config import (
     BATCH_FILE_PREFIX,
     CUT_FILE_PATTERN,
+    CUT_SUBDIR,
+    CUT_EXIT_ABORTED,
     CUT_ID_FORMAT,
+    CUT_WORKER_RESULT_PREFIX,
+    CUT_WORKER_SERVER_FLAG,
     DEFAULT_EDB_VERSION,
     RESULTS_DIR,
     SOURCE_DIR,
+    SSS_SUBDIR,
     STACKUP_DIR,
-    VALID_CUT_NAME_PATTERN,
+    VALID_CUT_NAME_RE,
+    error_message,
     error_response,
+    success_message,
     success_response,
 )
+from util.json_utils import load_json_file
 from util.logger_module import logger
 
 
 class Api:
     """JavaScript API for pywebview"""
 
-    def __init__(self, edb_path, edb_version=DEFAULT_EDB_VERSION, grpc=False):
+    def __init__(self, edb_path, edb_version=DEFAULT_EDB_VERSION, grpc=None):
         self.edb_path = edb_path
         self.edb_version = edb_version
         self.grpc = grpc
         self.data = None
+        self._cut_worker = None  # Persistent edb.cut worker process (started on first cut)
+        # pywebview runs each js_api call on its own thread; this lock serializes
+        # worker start/stop and each request/response exchange on its pipes
+        self._cut_worker_lock = threading.Lock()
+        self._cut_types = {}  # {cut file stem: cut type}, recorded when cut files are saved or listed
 
         # Extract EDB folder name from path
         if edb_path and edb_path != "test_path":
@@ -55,6 +69,10 @@ class Api:
             self.edb_folder_name = "test_data"
             self._edb_data_dir = SOURCE_DIR
 
+        # Cut and SSS directories are fixed per session; built once instead of per API call
+        self._cut_dir = self._edb_data_dir / CUT_SUBDIR
+        self._sss_dir = self._edb_data_dir / SSS_SUBDIR
+
     def _ensure_data_loaded(self):
         """
         Helper method to ensure EDB data is loaded into cache.
@@ -128,7 +146,7 @@ class Api:
     def save_cut_data(self, cut_data):
         """Save cut geometry data to EDB-specific cut folder"""
         try:
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
             cut_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate cut ID based on existing files
@@ -144,8 +162,9 @@ class Api:
             cut_file = cut_dir / f"{cut_id}.json"
             with open(cut_file, 'w', encoding='utf-8') as f:
                 json.dump(cut_data, f, indent=2)
+            self._cut_types[cut_id] = cut_data.get('type')
 
-            logger.info(f"Cut data saved: {cut_file}")
+            logger.info(success_message('cut_saved', path=cut_file))
             return success_response(id=cut_id, file=str(cut_file))
         except Exception as e:
             logger.error(f"Error saving cut data: {e}")
@@ -154,7 +173,7 @@ class Api:
     def get_cut_list(self):
         """Get list of saved cut files"""
         try:
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
             if not cut_dir.exists():
                 return []
 
@@ -166,8 +185,8 @@ class Api:
                     continue
 
                 try:
-                    with open(cut_file, 'r', encoding='utf-8') as f:
-                        cut_data = json.load(f)
+                    cut_data = load_json_file(cut_file)
+                    self._cut_types[cut_file.stem] = cut_data.get('type')
 
                     # Calculate point count from points array
                     points = cut_data.get('points', [])
@@ -191,12 +210,13 @@ class Api:
     def delete_cut(self, cut_id):
         """Delete a cut file"""
         try:
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
             cut_file = cut_dir / f"{cut_id}.json"
 
             if cut_file.exists():
                 cut_file.unlink()
-                logger.info(f"Deleted cut: {cut_file}")
+                self._cut_types.pop(cut_id, None)
+                logger.info(success_message('cut_deleted', path=cut_file))
                 return success_response()
             else:
                 return error_response('File not found')
@@ -208,14 +228,14 @@ class Api:
         """Rename a cut file"""
         try:
             # Validate new name format (alphanumeric + underscore only)
-            if not re.match(VALID_CUT_NAME_PATTERN, new_id):
-                return error_response('Invalid name format. Only letters, numbers, and underscores allowed.')
+            if not VALID_CUT_NAME_RE.match(new_id):
+                return error_response(error_message('invalid_cut_name'))
 
             # Check if old_id and new_id are the same
             if old_id == new_id:
                 return success_response(message='Name unchanged')
 
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
             old_file = cut_dir / f"{old_id}.json"
             new_file = cut_dir / f"{new_id}.json"
 
@@ -225,11 +245,10 @@ class Api:
 
             # Check if new name already exists
             if new_file.exists():
-                return error_response(f'Cut name "{new_id}" already exists')
+                return error_response(error_message('cut_exists', name=new_id))
 
             # Load cut data
-            with open(old_file, 'r', encoding='utf-8') as f:
-                cut_data = json.load(f)
+            cut_data = load_json_file(old_file)
 
             # Update id in data
             cut_data['id'] = new_id
@@ -240,8 +259,10 @@ class Api:
 
             # Delete old file
             old_file.unlink()
+            self._cut_types.pop(old_id, None)
+            self._cut_types[new_id] = cut_data.get('type')
 
-            logger.info(f"Renamed cut: {old_id} -> {new_id}")
+            logger.info(success_message('cut_renamed', old_id=old_id, new_id=new_id))
             return success_response(new_id=new_id)
 
         except Exception as e:
@@ -251,24 +272,136 @@ class Api:
     def get_cut_data(self, cut_id):
         """Get full data for a specific cut"""
         try:
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
             cut_file = cut_dir / f"{cut_id}.json"
 
             if cut_file.exists():
-                with open(cut_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json_file(cut_file)
             else:
                 return None
         except Exception as e:
             logger.info(f"Error loading cut data: {e}")
             return None
 
+    def _ensure_cut_worker(self):
+        """Start the persistent edb.cut worker process if it is not running (caller holds _cut_worker_lock)"""
+        if self._cut_worker is None or self._cut_worker.poll() is not None:
+            self._cut_worker = subprocess.Popen(
+                [sys.executable, "-u", "-m", "edb.cut", CUT_WORKER_SERVER_FLAG],
+                cwd=Path.cwd(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+            )
+
+    def _stop_cut_worker(self, timeout=10):
+        """
+        Stop the persistent edb.cut worker process.
+
+        Closing stdin ends the worker's serve loop; a worker that does not exit
+        within the timeout (e.g. still cutting) is killed. If a cut is still
+        running after the timeout, the worker is killed without waiting for the
+        lock; the waiting request then sees the worker exit and returns 1.
+
+        Args:
+            timeout: Seconds to wait for a clean exit (default: 10)
+        """
+        if not self._cut_worker_lock.acquire(timeout=timeout):
+            worker = self._cut_worker
+            if worker is not None and worker.poll() is None:
+                logger.warning("Cut worker is still busy, killing it")
+                worker.kill()
+                worker.wait()
+            return
+
+        try:
+            worker, self._cut_worker = self._cut_worker, None
+            if worker is None or worker.poll() is not None:
+                return
+
+            try:
+                worker.stdin.close()
+                worker.wait(timeout=timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                logger.warning("Cut worker did not exit cleanly, killing it")
+                worker.kill()
+                worker.wait()
+        finally:
+            self._cut_worker_lock.release()
+
+    def prepare_cut_worker(self):
+        """
+        Start the edb.cut worker ahead of the first cut execution.
+
+        Called when the cut executor opens, so interpreter and pyedb startup
+        overlap with the user selecting cuts. Does nothing if another call
+        holds the worker (a start in progress or a running cut).
+
+        Returns:
+            dict: {'success': bool, 'error': str (if failed)}
+        """
+        if not self._cut_worker_lock.acquire(blocking=False):
+            return success_response()
+        try:
+            self._ensure_cut_worker()
+            return success_response()
+        except Exception as e:
+            logger.warning(f"Failed to start cut worker: {e}")
+            return error_response(e)
+        finally:
+            self._cut_worker_lock.release()
+
+    def _run_cut_worker(self, batch_file_path):
+        """
+        Run a cut batch on the persistent edb.cut worker process.
+
+        The worker is started on first use and kept alive, so later batches skip
+        interpreter and pyedb startup. Worker output is echoed to the console
+        until its result line arrives.
+
+        Args:
+            batch_file_path: Path to batch JSON file
+
+        Returns:
+            int: Exit code reported by the worker (1 if the worker died)
+        """
+        # One request/response exchange at a time, so concurrent calls cannot
+        # start a second worker or read each other's results
+        with self._cut_worker_lock:
+            self._ensure_cut_worker()
+
+            request = {
+                'edb_path': self.edb_path,
+                'edb_version': self.edb_version,
+                'input_file': str(batch_file_path),
+                'grpc': self.grpc
+            }
+
+            try:
+                self._cut_worker.stdin.write(json.dumps(request) + "\n")
+                self._cut_worker.stdin.flush()
+
+                for line in self._cut_worker.stdout:
+                    if line.startswith(CUT_WORKER_RESULT_PREFIX):
+                        return json.loads(line[len(CUT_WORKER_RESULT_PREFIX):])['returncode']
+                    sys.stdout.write(line)
+            except (OSError, ValueError) as worker_error:
+                logger.warning(f"Cut worker communication failed: {worker_error}")
+
+            # Worker exited or broke the protocol; start a fresh one next time
+            logger.error("Cut worker terminated unexpectedly")
+            self._cut_worker = None
+            return 1
+
     def execute_cuts(self, cut_ids, selected_nets=None, use_stackup=True):
         """
         Execute cutting operations on EDB using selected cut geometries.
 
-        This runs edb.cut module in a subprocess to avoid pythonnet conflicts.
-        Multiple cuts are processed in a single subprocess session, with each cut
+        This runs edb.cut module in a persistent worker subprocess to avoid pythonnet
+        conflicts. Multiple cuts are processed in a single request, with each cut
         opening the original EDB independently.
 
         Args:
@@ -286,10 +419,10 @@ class Api:
                 cut_ids = [cut_ids]
 
             if not cut_ids:
-                return error_response('No cut IDs provided')
+                return error_response(error_message('no_cuts_provided'))
 
             # Get cut directory
-            cut_dir = self._edb_data_dir / 'cut'
+            cut_dir = self._cut_dir
 
             # Validate all cut files exist and build file paths
             cut_files = []
@@ -304,12 +437,12 @@ class Api:
             logger.info(f"{'=' * 70}")
 
             # Debug logging for selected nets
-            logger.debug(f"Received selected_nets parameter: {selected_nets}")
+            logger.debug("Received selected_nets parameter: %s", selected_nets)
             if selected_nets:
-                logger.debug(f"Signal nets count: {len(selected_nets.get('signal', []))}")
-                logger.debug(f"Power nets count: {len(selected_nets.get('power', []))}")
+                logger.debug("Signal nets count: %d", len(selected_nets.get('signal', [])))
+                logger.debug("Power nets count: %d", len(selected_nets.get('power', [])))
                 if selected_nets.get('signal'):
-                    logger.debug(f"Signal nets: {selected_nets.get('signal')}")
+                    logger.debug("Signal nets: %s", selected_nets.get('signal'))
             logger.info("")
 
             # Create batch JSON file with cut file paths, selected nets, and stackup flag
@@ -320,6 +453,12 @@ class Api:
                 'use_stackup': use_stackup
             }
 
+            # Record the cut type when known so the subprocess need not parse the
+            # first cut file before it can size the clones
+            first_cut_type = self._cut_types.get(cut_ids[0])
+            if first_cut_type:
+                batch_data['type'] = first_cut_type
+
             # Create temporary batch file in source folder
             SOURCE_DIR.mkdir(exist_ok=True)
             batch_filename = f"{BATCH_FILE_PREFIX}{int(time.time() * 1000)}.json"
@@ -329,17 +468,15 @@ class Api:
                 json.dump(batch_data, batch_file, indent=2)
 
             try:
-                # Run edb.cut package as subprocess with batch file
-                grpc_str = "True" if self.grpc else "False"
-                result = subprocess.run(
-                    [sys.executable, "-u", "-m", "edb.cut", self.edb_path, self.edb_version, batch_file_path, grpc_str],
-                    cwd=Path.cwd()
-                )
-
-                return_code = result.returncode
+                # Run batch on the persistent edb.cut worker subprocess
+                return_code = self._run_cut_worker(batch_file_path)
 
+                if return_code == CUT_EXIT_ABORTED:
+                    error_msg = error_message('cut_execution_aborted')
+                    logger.error(f"{error_msg}")
+                    return error_response(error_msg)
                 if return_code != 0:
-                    error_msg = f"Cut execution failed with code {return_code}"
+                    error_msg = error_message('cut_execution_failed', code=return_code)
                     logger.error(f"{error_msg}")
                     return error_response(error_msg)
 
@@ -358,7 +495,7 @@ class Api:
                         # Sort by modification time and get the most recent
                         latest_dir = max(result_dirs, key=lambda d: d.stat().st_mtime)
                         results_folder = str(latest_dir)
-                        logger.debug(f"Results folder for analysis: {results_folder}")
+                        logger.debug("Results folder for analysis: %s", results_folder)
 
                 return success_response(results_folder=results_folder)
 
@@ -999,7 +1136,7 @@ class Api:
         """
         try:
             # Check sss directory
-            sss_dir = self._edb_data_dir / 'sss'
+            sss_dir = self._sss_dir
 
             if not sss_dir.exists():
                 return {'success': True, 'sss_file': None}
@@ -1045,7 +1182,7 @@ class Api:
             root.wm_attributes('-topmost', 1)
 
             # Set initial directory to source/{edb_folder_name}/sss/
-            sss_dir = self._edb_data_dir / 'sss'
+            sss_dir = self._sss_dir
             initial_dir = sss_dir if sss_dir.exists() else self._edb_data_dir
 
             # Open file dialog
@@ -1153,7 +1290,7 @@ class Api:
                 return {'success': False, 'error': error_msg}
 
             # Create output path
-            sss_dir = self._edb_data_dir / 'sss'
+            sss_dir = self._sss_dir
             sss_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate .sss filenames
@@ -1210,7 +1347,7 @@ class Api:
             return {'success': False, 'error': error_msg}
 
 
-def start_gui(edb_path, edb_version="2025.1", grpc=False):
+def start_gui(edb_path, edb_version="2025.1", grpc=None):
     """Start the pywebview GUI"""
     api = Api(edb_path, edb_version, grpc)
 
@@ -1227,8 +1364,11 @@ def start_gui(edb_path, edb_version="2025.1", grpc=False):
         resizable=True
     )
 
-    # Start GUI
-    webview.start()
+    # Start GUI (blocks until the window is closed)
+    try:
+        webview.start()
+    finally:
+        api._stop_cut_worker()
 
 
 def launch_analysis_gui(results_folder, edb_version="2025.1", grpc=False):
@@ -7,7 +7,8 @@
 // Cut executor state
 let cutExecutor = {
     selectedCutIds: [],  // Changed from Set to Array to preserve selection order
-    isExecuting: false
+    isExecuting: false,
+    workerReady: null  // Promise for the background cut worker start
 };
 
 /**
@@ -21,6 +22,12 @@ async function openCutExecutor() {
     // Show modal
     modal.classList.remove('hidden');
 
+    // Start the cut worker in the background so its startup overlaps cut selection;
+    // executeSelectedCut awaits it before sending the first job
+    cutExecutor.workerReady = window.pywebview.api.prepare_cut_worker().catch(error => {
+        console.error('Failed to start cut worker:', error);
+    });
+
     // Auto-load latest SSS file
     try {
         const sssResult = await window.pywebview.api.get_latest_sss_file();
@@ -247,6 +254,8 @@ async function executeSelectedCut() {
         const sssSelected = sssPathElement && sssPathElement.textContent !== 'No file selected';
 
         // Call backend API to execute cuts with selected nets and SSS flag
+        // Let a background worker start finish before the job is sent
+        await cutExecutor.workerReady;
         const result = await window.pywebview.api.execute_cuts(cutIds, selectedNets, sssSelected);
 
         if (result.success) {
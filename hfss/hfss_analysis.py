@@ -11,6 +11,7 @@ from datetime import datetime
 from pathlib import Path
 
 from util.logger_module import logger
+from util.path_utils import ensure_dir, find_touchstone_file
 
 
 def _write_progress(analysis_folder, elapsed, timeout):
@@ -87,7 +88,7 @@ def run_hfss_analysis(aedb_path, edb_version, output_path):
 
         # Output directory is Analysis folder (parent of output_path)
         analysis_folder = output_path.parent
-        analysis_folder.mkdir(parents=True, exist_ok=True)
+        ensure_dir(analysis_folder)
 
         logger.info(f"Opening EDB with HFSS 3D Layout: {edb_file}")
         logger.info(f"EDB Version: {edb_version}")
@@ -211,10 +212,9 @@ def run_hfss_analysis(aedb_path, edb_version, output_path):
         _delete_progress(analysis_folder)
 
         # Check for generated Touchstone files (similar to siwave)
-        touchstone_files = list(analysis_folder.glob(f"{output_path.stem}.s*p"))
+        generated_file = find_touchstone_file(analysis_folder, output_path.stem)
 
-        if touchstone_files:
-            generated_file = touchstone_files[0]
+        if generated_file is not None:
             file_size = generated_file.stat().st_size
             if stopped_by_user:
                 logger.info("\n[OK] Analysis stopped by user, saved and exported!")
@@ -4,10 +4,10 @@ FPCB-Extractor Integration Module
 This module provides integration between the FPCB-Extractor package
 and the EDB Cutter application for advanced stackup processing.
 """
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from util.json_utils import load_json_file
 from util.logger_module import logger
 
 
@@ -55,8 +55,7 @@ def process_stackup_with_extractor(excel_file: str, merge_copper: bool = True) -
         logger.info(f"✓ Extraction completed: {output_path}")
 
         # Load the generated JSON to extract metadata
-        with open(output_path, 'r', encoding='utf-8') as f:
-            extracted_data = json.load(f)
+        extracted_data = load_json_file(output_path)
 
         # Extract sections from section_data
         section_data = extracted_data.get('section_data', {})
@@ -112,8 +111,7 @@ def extract_sections_from_json(json_file: str) -> List[str]:
         List of section names
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(json_file)
 
         section_data = data.get('section_data', {})
         sections = []
@@ -142,8 +140,7 @@ def get_layer_data_for_section(json_file: str, section_name: str) -> List[Dict]:
         List of layer dictionaries for the section
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(json_file)
 
         section_data = data.get('section_data', {})
 
@@ -201,8 +198,7 @@ def get_sss_copper_count_per_section(layer_sss_path: str) -> Dict:
             ...
         }
     """
-    with open(layer_sss_path, 'r', encoding='utf-8') as f:
-        sss_data = json.load(f)
+    sss_data = load_json_file(layer_sss_path)
 
     cut_layer_data = sss_data.get('cut_layer_data', {})
     results = {}
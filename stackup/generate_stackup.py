@@ -5,9 +5,9 @@ Generate XML stackup files from SSS v2.0 data.
 This module provides XML generation for ANSYS-compatible stackup files.
 Legacy Excel-based functions have been removed - use stackup_new for processing.
 """
+from util.json_utils import load_json_file
 from util.logger_module import logger
 import re
-import json
 from pathlib import Path
 from collections import OrderedDict
 
@@ -124,8 +124,7 @@ def load_cut_layer_data(sss_layers_file, cut_id):
         return None
 
     try:
-        with open(sss_layers_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(sss_layers_file)
 
         cut_layer_data = data.get('cut_layer_data', {})
 
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+from util.json_utils import load_json_file
 from util.logger_module import logger
 
 
@@ -34,8 +35,7 @@ class ExtractorSectionAdapter:
     def _load_data(self):
         """Load and parse the extractor JSON file."""
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
+            self._data = load_json_file(self.json_path)
             logger.info(f"Loaded extractor data from {self.json_path}")
         except Exception as e:
             logger.error(f"Failed to load extractor JSON: {e}")
@@ -0,0 +1,56 @@
+"""
+JSON helpers shared by the cut, stackup and EDB data modules.
+
+orjson is used when installed and the standard json module otherwise.
+Both parsers accept UTF-8 bytes, so files are read with a single
+read_bytes() call and parsed without a separate text decode step.
+"""
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str.
+
+    orjson rejects the NaN/Infinity literals that json.dump writes by
+    default; such input is re-parsed with the standard json module, so
+    every file the json module accepts still loads.
+
+    Args:
+        data: JSON document (bytes or str)
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If JSON parsing fails
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json_file(file_path):
+    """
+    Read and parse a UTF-8 JSON file.
+
+    Args:
+        file_path: Path to JSON file (str or Path)
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If JSON parsing fails
+    """
+    return loads(Path(file_path).read_bytes())
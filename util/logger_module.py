@@ -1,8 +1,10 @@
 # <2025> ANSYS, Inc. Unauthorized use, distribution, or duplication is prohibited
 
+import io
 import os
 import sys
 import logging
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
 from pathlib import Path
 
@@ -83,6 +85,8 @@ def setup_logger(save_folder=None, log_filename=None):
     fh = logging.FileHandler(log_file, encoding='utf-8')
     # 콘솔 핸들러 (터미널에 출력, stdout 사용)
     ch = logging.StreamHandler(sys.stdout)
+    # DEBUG records go to the log file only (see set_console_level)
+    ch.setLevel(logging.INFO)
 
     # 포매터 설정
     # 파일: 순수 텍스트 (색상 코드 없음)
@@ -134,12 +138,55 @@ def log_exception(context="Operation", error=None, level="error"):
         except Exception as e:
             log_exception("Database connection", e, level="warning")
     """
-    import traceback
-
+    # The traceback is formatted once by the logger (exc_info), so it reaches
+    # the log file and follows buffered_console_output instead of raw stderr
+    log = logger.warning if level == "warning" else logger.error
     if error:
-        if level == "warning":
-            logger.warning(f"Failed during {context}: {error}")
-        else:
-            logger.error(f"Failed during {context}: {error}")
+        log(f"Failed during {context}: {error}", exc_info=True)
+    else:
+        log(f"Failed during {context}", exc_info=True)
+
+
+def _console_handlers():
+    """Return the logger's console (non-file) stream handlers"""
+    return [
+        h for h in logger.handlers
+        if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
+    ]
+
+
+def set_console_level(level):
+    """Set the minimum level of records shown on the console
+
+    The log file handler is not affected.
+
+    Args:
+        level: Logging level (e.g. logging.DEBUG to also show debug records)
+    """
+    for handler in _console_handlers():
+        handler.setLevel(level)
+
+
+@contextmanager
+def buffered_console_output():
+    """Collect console output in memory and write it out once on exit
 
-    traceback.print_exc()
+    Both logger console output and plain print() calls inside the block are
+    buffered; the log file handler keeps writing immediately. Useful for
+    keeping per-clone output contiguous when clones run in parallel.
+
+    Example:
+        with buffered_console_output():
+            process_clone(...)
+    """
+    console_handlers = _console_handlers()
+    buffer = io.StringIO()
+    original_streams = [h.setStream(buffer) for h in console_handlers]
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        for handler, stream in zip(console_handlers, original_streams):
+            handler.setStream(stream)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
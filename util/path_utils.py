@@ -0,0 +1,143 @@
+"""
+Filesystem helpers shared by the analysis and cut modules.
+"""
+import errno
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Directories already created (or confirmed) by this process
+_CREATED_DIRS = set()
+
+# Copy-on-write copy command per platform (None: not available, always byte copy)
+if sys.platform.startswith('linux'):
+    _REFLINK_COPY_CMD = ('cp', '-R', '--reflink=always')
+elif sys.platform == 'darwin':
+    _REFLINK_COPY_CMD = ('cp', '-R', '-c')
+else:
+    _REFLINK_COPY_CMD = None
+
+# Cleared after the first failed reflink so later copies go straight to copytree
+_reflink_supported = _REFLINK_COPY_CMD is not None
+
+# In-kernel file copy (Linux); cleared after the first unsupported call
+_copy_file_range_supported = hasattr(os, 'copy_file_range')
+
+# copy_file_range errors meaning "not supported here" rather than a failed copy
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL}
+)
+
+
+def ensure_dir(directory):
+    """
+    Create a directory (with parents) once per process.
+
+    Later calls for the same path skip the mkdir syscall entirely.
+
+    Args:
+        directory: Directory path (str or Path)
+
+    Returns:
+        str: The directory path as a string
+    """
+    directory_str = os.fspath(directory)
+    if directory_str not in _CREATED_DIRS:
+        os.makedirs(directory_str, exist_ok=True)
+        _CREATED_DIRS.add(directory_str)
+    return directory_str
+
+
+def find_touchstone_file(directory, stem):
+    """
+    Find the first Touchstone file named {stem}.s<N>p in a directory.
+
+    Uses a single os.scandir pass that stops at the first match instead of
+    materializing a full glob result.
+
+    Args:
+        directory: Directory to search
+        stem: File name without the .s<N>p extension
+
+    Returns:
+        Path: Path to the Touchstone file, or None if not found
+    """
+    prefix = stem + '.s'
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith('p') and name[len(prefix):-1].isdigit() and entry.is_file():
+                return Path(entry.path)
+    return None
+
+
+def _copy_file(src, dst):
+    """
+    Copy file contents for copy_tree's byte-copy fallback.
+
+    On Linux os.copy_file_range copies inside the kernel (and shares blocks
+    where the filesystem supports it, even when cp --reflink=always failed
+    for the tree). Elsewhere, or when the call is not supported for these
+    files, shutil.copyfile is used. Other errors (e.g. opening the files)
+    propagate and leave copy_file_range enabled for later files.
+    """
+    global _copy_file_range_supported
+
+    if _copy_file_range_supported:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return dst
+            except OSError as e:
+                if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                    raise
+                _copy_file_range_supported = False
+        # Unsupported or short copy: rewrite the file with a regular copy
+
+    return shutil.copyfile(src, dst)
+
+
+def copy_tree(src, dst):
+    """
+    Copy a directory tree, using a copy-on-write clone when the filesystem supports it.
+
+    On Linux (Btrfs/XFS) and macOS (APFS) the tree is cloned with cp, so data
+    blocks are shared until one side modifies them. Otherwise, or when the
+    clone fails (e.g. ext4/NTFS or a cross-device copy), shutil.copytree is used.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist yet for the clone path)
+
+    Returns:
+        bool: True if the tree was cloned copy-on-write, False if bytes were copied
+    """
+    global _reflink_supported
+
+    src_str = os.fspath(src)
+    dst_str = os.fspath(dst)
+
+    if _reflink_supported and not os.path.exists(dst_str):
+        result = subprocess.run(
+            [*_REFLINK_COPY_CMD, src_str, dst_str],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if result.returncode == 0:
+            return True
+        _reflink_supported = False
+        # Remove any partial clone before falling back to a byte copy
+        shutil.rmtree(dst_str, ignore_errors=True)
+
+    # Contents only instead of the default copy2: clones need file contents, so
+    # the per-file copystat (utime/chmod/xattr syscalls) is skipped
+    shutil.copytree(src_str, dst_str, copy_function=_copy_file, dirs_exist_ok=True)
+    return False